@@ -1,5 +1,6 @@
 """Contains a Cog for all administrative funcionality."""
 
+import asyncio
 import json
 from typing import Optional, Mapping
 
@@ -454,14 +455,14 @@ class AdminCog(commands.Cog):
             channel (discord.Textchannel): The channel that is to be made bot-only
         """
         target_channel = channel if channel is not None else ctx.channel
-        is_channel_botonly = self._db_connector.is_botonly(target_channel.id)
+        is_channel_botonly = await asyncio.to_thread(self._db_connector.is_botonly, target_channel.id)
 
         if is_channel_botonly:
             log.info("Deactivated bot-only mode for channel [#%s]", target_channel)
-            self._db_connector.deactivate_botonly(target_channel.id)
+            await asyncio.to_thread(self._db_connector.deactivate_botonly, target_channel.id)
         else:
             log.info("Activated bot-only mode for channel [#%s]", target_channel)
-            self._db_connector.activate_botonly(target_channel.id)
+            await asyncio.to_thread(self._db_connector.activate_botonly, target_channel.id)
 
         is_enabled_string = 'aktiviert' if not is_channel_botonly else 'deaktiviert'
         embed = _build_botonly_embed(is_enabled_string)
@@ -476,7 +477,7 @@ class AdminCog(commands.Cog):
         Args:
             message (discord.Message): The context this method was called in. Must always be a message.
         """
-        if not message.author.bot and self._db_connector.is_botonly(message.channel.id):
+        if not message.author.bot and await asyncio.to_thread(self._db_connector.is_botonly, message.channel.id):
             await message.delete()
 
 
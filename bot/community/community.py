@@ -1,4 +1,5 @@
 """Contains a Cog for all community related functionality."""
+import asyncio
 import re
 from typing import Optional
 from datetime import datetime, timedelta
@@ -177,7 +178,7 @@ class CommunityCog(commands.Cog):
             payload (discord.RawReactionActionEvent): The payload for the triggered event.
         """
         if payload.emoji.name != const.EMOJI_HIGHLIGHT or payload.channel_id == int(const.CHANNEL_ID_HIGHLIGHTS) \
-                or self._db_connector.is_botonly(payload.channel_id):
+                or await asyncio.to_thread(self._db_connector.is_botonly, payload.channel_id):
             return
 
         guild = self.bot.get_guild(payload.guild_id)
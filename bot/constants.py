@@ -48,8 +48,17 @@ LIMIT_WARNINGS_LVL_1 = 3
 LIMIT_WARNINGS_LVL_2 = 5
 LIMIT_WARNINGS_LVL_3 = 6
 
+LIMIT_CONCURRENT_UNBANS = 10
+LIMIT_MODLOG_QUEUE = 100
+
 LIMIT_COMMUNITY_CHANNELS = 20
 LIMIT_SONG_QUEUE = 300
+LIMIT_MEDIA_INFO_CACHE = 64
+LIMIT_MEDIA_INFO_AGE = 30  # minutes
+
+LIMIT_EMBED_FIELDS = 25  # Imposed by Discord
+LIMIT_EMBED_CHARACTERS = 6000  # Imposed by Discord
+LIMIT_EMBEDS_PER_MESSAGE = 10  # Imposed by Discord
 
 # Timeouts
 TIMEOUT_USER_INTERACTION = 180
@@ -57,6 +66,11 @@ TIMEOUT_USER_SELECTION = 30
 TIMEOUT_INFORMATION = 15
 TIMEOUT_COMMUNITY_ROOM = 300
 
+# Delays
+DELAY_MODMAIL_STATUS_FLUSH = 0.25  # seconds
+DELAY_MODLOG_BATCH = 5  # seconds
+DELAY_WARNING_CHECK = 2  # seconds
+
 # Discord Server Boosts
 DISCORD_BOOST_LVL1_CAP = 2
 DISCORD_BOOST_LVL2_CAP = 7
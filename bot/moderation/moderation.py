@@ -1,8 +1,11 @@
 """Contains a Cog for all functionality regarding Moderation."""
-import operator
+import asyncio
+import heapq
 import re
+from contextlib import suppress
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from itertools import chain
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 import discord
 from discord import utils
@@ -12,9 +15,78 @@ from bot import singletons, constants as const
 from bot.logger import command_log, log
 from bot.moderation import ModmailStatus
 from bot.persistence import DatabaseConnector
+from bot.ui import ConfirmationView
 from bot.utility.time_parsing import get_future_timestamp, get_pretty_string_duration
 
 
+# Title and color of a modmail embed depending on the status of the modmail.
+_MODMAIL_STATUS_EMBED = {ModmailStatus.OPEN: ("Status: Offen", const.EMBED_COLOR_MODMAIL_OPEN),
+                         ModmailStatus.ASSIGNED: ("Status: In Bearbeitung", const.EMBED_COLOR_MODMAIL_ASSIGNED),
+                         ModmailStatus.CLOSED: ("Status: Erledigt", const.EMBED_COLOR_MODMAIL_CLOSED)}
+_MODMAIL_STATUS_BY_COLOR = {color: status for status, (_title, color) in _MODMAIL_STATUS_EMBED.items()}
+
+# Title and color of the embed listing all modmail with a specific status as well as the title, color and description
+# used if there isn't any modmail with said status.
+_MODMAIL_LIST_EMBED = {ModmailStatus.OPEN: ("Offenen Tickets: {0}", const.EMBED_COLOR_MODMAIL_OPEN),
+                       ModmailStatus.ASSIGNED: ("Zugewiesene Tickets: {0}", const.EMBED_COLOR_MODMAIL_ASSIGNED)}
+_MODMAIL_EMPTY_LIST_EMBED = {
+    ModmailStatus.OPEN: ("Keine offenen Tickets! :tada:", const.EMBED_COLOR_MODMAIL_CLOSED,
+                         "Lehne dich zurück und entspanne ein wenig. Momentan gibt es für dich keine Tickets, welche du "
+                         "abarbeiten könntest. :beers:"),
+    ModmailStatus.ASSIGNED: ("Keine Tickets in Bearbeitung! :eyes:", const.EMBED_COLOR_MODMAIL_ASSIGNED,
+                             "**Es ist ruhig, zu ruhig...** Vielleicht gibt es momentan ja ein paar offene Tickets die "
+                             "bearbeitet werden müssten.")
+}
+_PUBLIC_COMMANDS = frozenset(("report", "modmail", "answered"))
+_MODMAIL_EMOJIS = frozenset((const.EMOJI_MODMAIL_DONE, const.EMOJI_MODMAIL_ASSIGN))
+
+_MOD_ACTION_NOTE = "Versuch bitte, dich in Zukunft besser an unsere {rules} zu halten, da wir ansonsten gezwungen sind, " \
+                   "härtere Strafen zu verhängen. :scales:"
+_UNMUTE_DM = "Hey, {name}! :wave:\nDu bist nicht mehr stummgeschalten! :speaker: Versuch bitte, dich in Zukunft besser " \
+             "an unsere {rules} zu halten, da wir ansonsten gezwungen sind, härtere Strafen zu verhängen. :scales:"
+_UNBAN_DM = "Hey, {name}! :wave:\nDu bist nicht mehr von **__{guild}__** gebannt! :unlock: Versuch bitte, dich in " \
+            "Zukunft besser an unsere {rules} zu halten, da wir ansonsten gezwungen sind, dich dauerhaft zu bannen. " \
+            ":scales:"
+_PURGE_CONFIRMATION = "**Bist du dir sicher, dass du im Kanal {channel} __{amount} Nachrichten__ löschen " \
+                      "möchtest?**\nDiese Operation kann nicht rückgängig gemacht werden! Überlege dir daher gut, ob " \
+                      "du das auch wirklich tun möchtest."
+_REPORT_DATE_FORMAT = "%d.%m.%Y - %H:%M"
+_NICKNAMES_DESCRIPTION = f"Es werden maximal die __letzten {const.LIMIT_NICKNAMES} Namen__ eines Mitglieds angezeigt, " \
+                         f"welche auf diesem Server verwendet wurden."
+_NEW_MEMBERS_DESCRIPTION = f"Füge an das Ende des Befehls eine beliebige Zahl an, um die Menge an neuen Mitgliedern " \
+                           f"individuell festzulegen. **(max. {const.LIMIT_NEW_MEMBERS})**"
+_END_DATE_FORMAT = "%d.%m.%Y %H:%M:%S"
+_WARNING_DATE_FORMAT = "%d.%m.%Y um %H:%M"
+_TICKET_DATE_FORMAT = "%d.%m.%Y %H:%M"
+_IMAGE_EXTENSIONS = frozenset(("jpg", "jpeg", "png", "gif"))
+
+# Regexes for getting the text between two quotes in error messages.
+_DOUBLE_QUOTED_TEXT = re.compile(r"\"(.*)\"")
+_SINGLE_QUOTED_TEXT = re.compile(r"\'(.*)\'")
+
+# The info embeds posted when a lockdown is put in place or lifted never change and are therefore only created once.
+_LOCKDOWN_DESCRIPTION = "{subject} befindet sich aufgrund von Unruhen derzeit im Lockdown, weswegen das Versenden von " \
+                        "Nachrichten vorübergehend nicht möglich ist. :mailbox_with_no_mail:\n\nDie Moderatoren sind " \
+                        "bemüht, die Ordnung schnellstmöglich wiederherzustellen. Bitte haltet davon ab, sie bezüglich " \
+                        "der aktuellen Situation zu kontaktieren, da dies die Wiedereröffnung des Kanals nur unnötig " \
+                        "verzögern würde.\n\n**__Wir bitten um Verständnis.__ :heart:**"
+_LOCKDOWN_LIFT_DESCRIPTION = "{subject} wurde aufgehoben und es können wieder ungehindert Nachrichten versendet werden. " \
+                             "\n\n**__Vielen Dank für die Geduld.__** :handshake:"
+
+_LOCKDOWN_EMBED = discord.Embed(title=":rotating_light: LOCKDOWN :rotating_light:", color=const.EMBED_COLOR_WARNING,
+                                description=_LOCKDOWN_DESCRIPTION.format(subject="Dieser Kanal"))
+_SERVER_LOCKDOWN_EMBED = discord.Embed(title=":rotating_light: LOCKDOWN :rotating_light:",
+                                       color=const.EMBED_COLOR_WARNING,
+                                       description=_LOCKDOWN_DESCRIPTION.format(subject="Der gesamte Server"))
+_LOCKDOWN_LIFT_EMBED = discord.Embed(title=":sparkles: Lockdown-Aufhebung :sparkles:", color=const.EMBED_COLOR_INFO,
+                                     description=_LOCKDOWN_LIFT_DESCRIPTION.format(
+                                         subject="Der Lockdown für diesen Kanal"))
+_SERVER_LOCKDOWN_LIFT_EMBED = discord.Embed(title=":sparkles: Lockdown-Aufhebung :sparkles:",
+                                            color=const.EMBED_COLOR_INFO,
+                                            description=_LOCKDOWN_LIFT_DESCRIPTION.format(
+                                                subject="Der serverweite Lockdown"))
+
+
 class ModerationCog(commands.Cog):
     """Cog for Moderation Functions."""
 
@@ -34,23 +106,95 @@ class ModerationCog(commands.Cog):
         ModerationCog.bot = self.bot
         ModerationCog.db_connector = self._db_connector
 
+        # Semaphore limiting the amount of unbans done concurrently by the scheduled jobs, of which there can be a lot at
+        # once (e.g. after a restart of the bot). Each job awaits its unban itself so that none of them gets lost.
+        ModerationCog.unban_semaphore = asyncio.Semaphore(const.LIMIT_CONCURRENT_UNBANS)
+
+        # Queue containing the embeds which should be posted in the modlog channel. They are posted in batches of up to
+        # 10 embeds per message, which saves a lot of requests during busy times (e.g. a raid).
+        # The embeds taken from the queue by the worker which haven't been posted yet are kept so that none of them get
+        # lost if the worker is stopped.
+        ModerationCog.modlog_queue = asyncio.Queue(maxsize=const.LIMIT_MODLOG_QUEUE)
+        self._modlog_batch = []
+        self._modlog_worker = asyncio.create_task(self._process_modlog_entries())
+
+        # Status changes of modmail which haven't been written to the database yet. Reactions are often toggled in quick
+        # succession, so only the final status of each modmail is written once the changes have settled.
+        self._pending_modmail_status = {}
+        self._modmail_status_flush = None
+
+        # Recalculations of the expiration date of warnings which are due after warnings have been removed, as well as
+        # the context of the last removal, the member and the amount of removed warnings per user. Moderators often
+        # remove several warnings in a row, which is why only a single recalculation is done once no further warning of
+        # the same user has been removed for a short time.
+        self._warning_checks = {}
+        self._removed_warnings = {}
+
+        # Requests for fetching modmail which aren't in the message cache. Moderators reacting to the same modmail at the
+        # same time share a single request instead of fetching the same message several times.
+        self._modmail_fetches = {}
+
+        # Punishments which are imposed automatically once a member has received a specific amount of warnings, along
+        # with their duration (if temporary). The commands of the cog are used directly instead of looking them up by
+        # their name every time.
+        self._warning_punishments = {
+            const.LIMIT_WARNINGS_LVL_1:      (self.tempmute_user, "1 week"),
+            const.LIMIT_WARNINGS_LVL_2:      (self.tempban_user, "2 weeks"),
+            const.LIMIT_WARNINGS_LVL_3:      (self.ban_user, None)
+        }
+
+        # Guild instance
+        self.guild = bot.get_guild(int(const.SERVER_ID))
+
         # Channel instances
-        self.ch_modlog = bot.get_guild(int(const.SERVER_ID)).get_channel(int(const.CHANNEL_ID_MODLOG))
-        self.ch_report = bot.get_guild(int(const.SERVER_ID)).get_channel(int(const.CHANNEL_ID_REPORT))
-        self.ch_modmail = bot.get_guild(int(const.SERVER_ID)).get_channel(int(const.CHANNEL_ID_MODMAIL))
-        self.ch_rules = bot.get_guild(int(const.SERVER_ID)).get_channel(int(const.CHANNEL_ID_RULES))
-        self.ch_server_news = bot.get_guild(int(const.SERVER_ID)).get_channel(int(const.CHANNEL_ID_NEWS))
+        self.ch_modlog = self.guild.get_channel(int(const.CHANNEL_ID_MODLOG))
+        self.ch_report = self.guild.get_channel(int(const.CHANNEL_ID_REPORT))
+        self.ch_modmail = self.guild.get_channel(int(const.CHANNEL_ID_MODMAIL))
+        self.ch_rules = self.guild.get_channel(int(const.CHANNEL_ID_RULES))
+        self.ch_server_news = self.guild.get_channel(int(const.CHANNEL_ID_NEWS))
+
+        # The mention of the rules channel as well as the note added to the info embeds of mod actions never change and
+        # are therefore composed once instead of every time a member gets punished.
+        self._rules_mention = self.ch_rules.mention
+        self._mod_action_note = _MOD_ACTION_NOTE.format(rules=self._rules_mention)
 
         # Role instances
-        self.role_moderator = bot.get_guild(int(const.SERVER_ID)).get_role(int(const.ROLE_ID_MODERATOR))
-        self.role_muted = bot.get_guild(int(const.SERVER_ID)).get_role(int(const.ROLE_ID_MUTED))
+        self.role_moderator = self.guild.get_role(int(const.ROLE_ID_MODERATOR))
+        self.role_muted = self.guild.get_role(int(const.ROLE_ID_MUTED))
+
+    async def cog_unload(self):
+        """Stops the worker processing modlog entries and writes pending modmail status changes as well as modlog
+        entries when the cog gets unloaded."""
+        self._modlog_worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._modlog_worker
+
+        if self._modmail_status_flush:
+            self._modmail_status_flush.cancel()
+        if self._pending_modmail_status:
+            await asyncio.to_thread(self._db_connector.change_modmail_statuses, self._pending_modmail_status)
+            self._pending_modmail_status = {}
+
+        # Pending recalculations of the expiration date of warnings are done right away instead of being lost.
+        for user_id in list(self._warning_checks):
+            await self._run_warning_check(*self._cancel_warning_check(user_id))
+
+        # The modlog entries are posted last so that failing requests can't prevent the pending changes from being done.
+        modlog_entries = _get_queued_items(ModerationCog.modlog_queue, self._modlog_batch,
+                                           len(self._modlog_batch) + const.LIMIT_MODLOG_QUEUE)
+        for embeds in _group_embeds(modlog_entries):
+            try:
+                await self.ch_modlog.send(embeds=embeds)
+            except discord.HTTPException as error:
+                log.error("%s modlog entries couldn't be posted: %s", len(embeds), error)
 
     # A special method that registers as a commands.check() for every command and subcommand in this cog.
     # Only moderators can use the commands defined in this Cog except for `report` and `modmail`.
     def cog_check(self, ctx):
-        if ctx.command.name in ["report", "modmail", "answered"]:
+        if ctx.command.name in _PUBLIC_COMMANDS:
             return True
-        return self.role_moderator in ctx.author.roles
+        # Member.get_role() does a binary search on the member's role ids instead of building a list of Role objects.
+        return ctx.author.get_role(self.role_moderator.id) is not None
 
     @commands.command(name="pin", hidden=True)
     @command_log
@@ -202,16 +346,17 @@ class ModerationCog(commands.Cog):
 
         if is_confirmed:
             overwrite.update(send_messages=False, connect=False)
-            await channel.set_permissions(ctx.guild.default_role, overwrite=overwrite,
-                                          reason=f"Der Kanal wurde von {ctx.author} in einen Lockdown versetzt.")
-            log.info("Channel [#%s] has been put into Lockdown.", channel)
 
-            embed = _build_lockdown_embed()
-            await channel.send(embed=embed)
+            # The bot is still able to post the information since the lockdown only affects the default role.
+            await asyncio.gather(
+                channel.set_permissions(ctx.guild.default_role, overwrite=overwrite,
+                                        reason=f"Der Kanal wurde von {ctx.author} in einen Lockdown versetzt."),
+                channel.send(embed=_LOCKDOWN_EMBED))
+            log.info("Channel [#%s] has been put into Lockdown.", channel)
 
             modlog_embed = _build_modlog_embed("Channel-Lockdown :lock:", color=const.EMBED_COLOR_MODLOG_LOCKDOWN,
                                                moderator=ctx.author, user=None, reason=None)
-            await self.ch_modlog.send(embed=modlog_embed)
+            await _post_modlog_entry(modlog_embed)
 
     @lockdown.command(name='lift')
     @command_log
@@ -234,17 +379,17 @@ class ModerationCog(commands.Cog):
             return
 
         overwrite.update(send_messages=None, connect=None)
-        await channel.set_permissions(ctx.guild.default_role, overwrite=overwrite,
-                                      reason=f"Der Lockdown wurde von {ctx.author} aufgehoben.")
-        log.info("Lockdown for channel [#%s] has been lifted.", channel)
 
-        embed = _build_lockdown_lift_embed()
-        await channel.send(embed=embed)
+        await asyncio.gather(
+            channel.set_permissions(ctx.guild.default_role, overwrite=overwrite,
+                                    reason=f"Der Lockdown wurde von {ctx.author} aufgehoben."),
+            channel.send(embed=_LOCKDOWN_LIFT_EMBED))
+        log.info("Lockdown for channel [#%s] has been lifted.", channel)
 
         modlog_embed = _build_modlog_embed("Aufhebung: Channel-Lockdown :unlock:",
                                            color=const.EMBED_COLOR_MODLOG_REPEAL, moderator=ctx.author, user=None,
                                            reason=None)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await _post_modlog_entry(modlog_embed)
 
     @lockdown.group(name='server', invoke_without_command=True)
     @command_log
@@ -269,16 +414,17 @@ class ModerationCog(commands.Cog):
 
         if is_confirmed:
             permissions.update(send_messages=False, connect=False)
-            await role.edit(permissions=permissions, reason=f"Der Server wurde von {ctx.author} in einen Lockdown "
-                                                            f"versetzt.")
-            log.info("The whole Server has been put into Lockdown.")
 
-            embed = _build_server_lockdown_embed()
-            await self.ch_server_news.send(embed=embed)
+            # The bot is still able to post the information since the lockdown only affects the default role.
+            await asyncio.gather(
+                role.edit(permissions=permissions, reason=f"Der Server wurde von {ctx.author} in einen Lockdown "
+                                                          f"versetzt."),
+                self.ch_server_news.send(embed=_SERVER_LOCKDOWN_EMBED))
+            log.info("The whole Server has been put into Lockdown.")
 
             modlog_embed = _build_modlog_embed("Server-Lockdown :lock:", color=const.EMBED_COLOR_MODLOG_LOCKDOWN,
                                                moderator=ctx.author, user=None, reason=None)
-            await self.ch_modlog.send(embed=modlog_embed)
+            await _post_modlog_entry(modlog_embed)
 
     @lockdown_server.command(name='lift')
     @command_log
@@ -299,16 +445,16 @@ class ModerationCog(commands.Cog):
             return
 
         permissions.update(send_messages=True, connect=True)
-        await role.edit(permissions=permissions, reason=f"Der serverweite Lockdown wurde von {ctx.author} aufgehoben.")
-        log.info("The server-wide Lockdown has been lifted.")
 
-        embed = _build_server_lockdown_lift_embed()
-        await self.ch_server_news.send(embed=embed)
+        await asyncio.gather(
+            role.edit(permissions=permissions, reason=f"Der serverweite Lockdown wurde von {ctx.author} aufgehoben."),
+            self.ch_server_news.send(embed=_SERVER_LOCKDOWN_LIFT_EMBED))
+        log.info("The server-wide Lockdown has been lifted.")
 
         modlog_embed = _build_modlog_embed("Aufhebung: Server-Lockdown :unlock:",
                                            color=const.EMBED_COLOR_MODLOG_REPEAL,
                                            moderator=ctx.author, user=None, reason=None)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await _post_modlog_entry(modlog_embed)
 
     @commands.command(name='warnings', hidden=True)
     @command_log
@@ -321,7 +467,7 @@ class ModerationCog(commands.Cog):
             ctx (discord.ext.commands.Context): The context in which the command was called.
             user (discord.Member): The member whose warnings have been requested.
         """
-        warnings = self._db_connector.get_member_warnings(user.id)
+        warnings = await asyncio.to_thread(self._db_connector.get_member_warnings, user.id)
 
         if warnings:
             embed = _build_warnings_embed(user, warnings)
@@ -342,19 +488,18 @@ class ModerationCog(commands.Cog):
             user (discord.Member): The member whose has been warned.
             reason (Optional[str]): The reason provided by the moderator.
         """
-        self._db_connector.add_member_warning(user.id, utils.utcnow(), reason)
+        await asyncio.to_thread(self._db_connector.add_member_warning, user.id, utils.utcnow(), reason)
         log.info("Member %s has been warned.", user)
 
-        await ctx.send(f"{user.mention} wurde verwarnt. :warning:")
-
         embed = _build_mod_action_embed("Verwarnungs", f"Du wurdest von **__{ctx.author}__** verwarnt.", reason,
-                                        self.ch_rules)
-        await user.send(embed=embed)
-
+                                        self._mod_action_note)
         modlog_embed = _build_modlog_embed("Verwarnung :warning:", color=const.EMBED_COLOR_MODLOG_WARN,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await asyncio.gather(ctx.send(f"{user.mention} wurde verwarnt. :warning:"), _send_dm(user, embed=embed),
+                             _post_modlog_entry(modlog_embed))
 
+        # The new warning resets the expiration date anyway, which makes a pending recalculation obsolete.
+        self._cancel_warning_check(user.id)
         await self.check_warnings(ctx, user)
 
     @warn_user.command(name='remove')
@@ -369,22 +514,24 @@ class ModerationCog(commands.Cog):
             warning_id (int): The id of the warning which should be removed.
             reason (Optional[str]): The reason provided by the moderator.
         """
-        user_id = self._db_connector.get_warning_userid(warning_id)
+        user_id = await asyncio.to_thread(self._db_connector.get_warning_userid, warning_id)
 
         if not user_id:
             raise commands.BadArgument("The warning with the specified ID doesn't exist.")
 
-        user = self.bot.get_guild(int(const.SERVER_ID)).get_member(user_id)
+        user = self.guild.get_member(user_id)
 
-        self._db_connector.remove_member_warning(warning_id)
+        await asyncio.to_thread(self._db_connector.remove_member_warning, warning_id)
         log.info("Warning #%s has been removed from %s.", warning_id, user)
 
         # Check warnings and recalculate expiration date if needed
-        await self.check_warnings(ctx, user, False)
+        _, _, removed_warnings = self._cancel_warning_check(user.id) or (None, None, 0)
+        self._removed_warnings[user.id] = (ctx, user, removed_warnings + 1)
+        self._warning_checks[user.id] = asyncio.create_task(self._check_warnings_after_removal(user.id))
 
         modlog_embed = _build_modlog_embed("Aufhebung: Verwarnung", color=const.EMBED_COLOR_MODLOG_REPEAL,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await _post_modlog_entry(modlog_embed)
 
         await ctx.send(f"Die Verwarnung für {user.mention} wurde erfolgreich aufgehoben. :white_check_mark:")
 
@@ -414,17 +561,18 @@ class ModerationCog(commands.Cog):
             user (discord.Member): The member whose warnings should be cleared.
             reason (Optional[str]): The reason provided by the moderator.
         """
-        self._db_connector.remove_member_warnings(user.id)
+        await asyncio.to_thread(self._db_connector.remove_member_warnings, user.id)
         log.info("All warnings have been removed from %s.", user)
 
+        # A pending recalculation of the expiration date isn't needed anymore either
+        self._cancel_warning_check(user.id)
+
         # Remove scheduler job from DB because it isn't needed anymore
-        clear_warnings_job = singletons.SCHEDULER.get_job(f"warns_expire_{user.id}")
-        if clear_warnings_job:
-            clear_warnings_job.remove()
+        await asyncio.to_thread(_remove_scheduler_job, f"warns_expire_{user.id}")
 
         modlog_embed = _build_modlog_embed("Aufhebung: Alle Verwarnungen", color=const.EMBED_COLOR_MODLOG_REPEAL,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await _post_modlog_entry(modlog_embed)
 
         await ctx.send(f"Alle Verwarnungen für {user.mention} wurden erfolgreich aufgehoben. :white_check_mark:")
 
@@ -441,21 +589,19 @@ class ModerationCog(commands.Cog):
             user (discord.Member): The member who should be muted.
             reason (Optional[str]): The reason provided by the moderator.
         """
-        if self.role_muted in user.roles:
+        if user.get_role(self.role_muted.id):
             await ctx.send("Dieser Nutzer ist bereits stummgeschalten. :flushed:")
             return
 
         await user.add_roles(self.role_muted, reason=reason)
         log.info("Member %s has been muted.", user)
 
-        await ctx.send(f"{user.mention} wurde stummgeschalten. :mute:")
         embed = _build_mod_action_embed("Stummschaltungs", f"Du wurdest von **__{ctx.author}__** auf unbestimmte Zeit "
-                                                           f"stummgeschalten.", reason, self.ch_rules)
-        await user.send(embed=embed)
-
+                                                           f"stummgeschalten.", reason, self._mod_action_note)
         modlog_embed = _build_modlog_embed("Stummschaltung :mute:", color=const.EMBED_COLOR_MODLOG_MUTE,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await asyncio.gather(ctx.send(f"{user.mention} wurde stummgeschalten. :mute:"), _send_dm(user, embed=embed),
+                             _post_modlog_entry(modlog_embed))
 
     @commands.command(name='unmute', hidden=True)
     @command_log
@@ -469,14 +615,12 @@ class ModerationCog(commands.Cog):
             user (discord.Member): The member who should be unmuted.
             reason (Optional[str]): The reason provided by the moderator.
         """
-        if self.role_muted not in user.roles:
+        if not user.get_role(self.role_muted.id):
             await ctx.send("Dieser Nutzer ist nicht stummgeschalten. :thinking:")
             return
 
         # Check if the user has been tempmuted and remove the job in the DB if that's the case
-        unmute_job = singletons.SCHEDULER.get_job(f"tempmute_expire_{user.id}")
-        if unmute_job:
-            unmute_job.remove()
+        await asyncio.to_thread(_remove_scheduler_job, f"tempmute_expire_{user.id}")
 
         await user.remove_roles(self.role_muted, reason=reason)
         log.info("Member %s has been unmuted.", user)
@@ -484,12 +628,9 @@ class ModerationCog(commands.Cog):
         modlog_embed = _build_modlog_embed("Aufhebung: Stummschaltung :speaker:",
                                            color=const.EMBED_COLOR_MODLOG_REPEAL,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
-
-        await ctx.send(f"{user.mention} ist nicht mehr stummgeschalten. :speaker:")
-        await user.send(f"Hey, {user.display_name}! :wave:\nDu bist nicht mehr stummgeschalten! :speaker: Versuch "
-                        f"bitte, dich in Zukunft besser an unsere {self.ch_rules.mention} zu halten, da wir ansonsten "
-                        f"gezwungen sind, härtere Strafen zu verhängen. :scales:")
+        await asyncio.gather(_post_modlog_entry(modlog_embed),
+                             ctx.send(f"{user.mention} ist nicht mehr stummgeschalten. :speaker:"),
+                             _send_dm(user, _UNMUTE_DM.format(name=user.display_name, rules=self._rules_mention)))
 
     @commands.command(name='tempmute', hidden=True)
     @command_log
@@ -508,29 +649,29 @@ class ModerationCog(commands.Cog):
             reason (Optional[str]): The reason provided by the moderator.
             bot_activated (bool): A boolean indicating if this command was automatically invoked by the bot.
         """
-        if self.role_muted in user.roles:
+        if user.get_role(self.role_muted.id):
             await ctx.send("Dieser Nutzer ist bereits stummgeschalten. :flushed:")
             return
 
         prosecutor = self.bot.user if bot_activated else ctx.author
         run_date = get_future_timestamp(duration)
         pretty_duration = get_pretty_string_duration(duration)
+        end_date = run_date.strftime(_END_DATE_FORMAT)
 
         await user.add_roles(self.role_muted, reason=reason)
-        log.info("Member %s has been muted until %s.", user, run_date.strftime("%d.%m.%Y %H:%M:%S"))
+        log.info("Member %s has been muted until %s.", user, end_date)
 
-        await ctx.send(f"{user.mention} wurde für {pretty_duration} stummgeschalten. :mute:")
         embed = _build_mod_action_embed("Tempmute", f"Du wurdest von **__{prosecutor}__** für {pretty_duration} "
-                                                    f"stummgeschalten.", reason, self.ch_rules)
-        await user.send(embed=embed)
-
-        details = "Endet in {0} ({1})".format(pretty_duration, run_date.strftime("%d.%m.%Y %H:%M:%S"))
+                                                    f"stummgeschalten.", reason, self._mod_action_note)
+        details = f"Endet in {pretty_duration} ({end_date})"
         modlog_embed = _build_modlog_embed("Temporäre Stummschaltung :mute:", color=const.EMBED_COLOR_MODLOG_MUTE,
                                            moderator=ctx.author, user=user, reason=reason, details=details)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await asyncio.gather(ctx.send(f"{user.mention} wurde für {pretty_duration} stummgeschalten. :mute:"),
+                             _send_dm(user, embed=embed), _post_modlog_entry(modlog_embed))
 
-        singletons.SCHEDULER.add_job(_scheduled_unmute_user, trigger="date", run_date=run_date, args=[user.id],
-                                     id=f"tempmute_expire_{user.id}", replace_existing=True)
+        await asyncio.to_thread(singletons.SCHEDULER.add_job, _scheduled_unmute_user, trigger="date",
+                                run_date=run_date, args=[user.id], id=f"tempmute_expire_{user.id}",
+                                replace_existing=True)
 
     @commands.command(name='ban', hidden=True)
     @command_log
@@ -549,18 +690,18 @@ class ModerationCog(commands.Cog):
         prosecutor = self.bot.user if bot_activated else ctx.author
 
         embed = _build_mod_action_embed("Bann", "Du wurdest durch **__{0}__** von **__{1}__** gebannt."
-                                        .format(prosecutor, self.bot.get_guild(int(const.SERVER_ID))),
-                                        reason, self.ch_rules)
-        await user.send(embed=embed)
+                                        .format(prosecutor, self.guild),
+                                        reason, None)
+        # The DM has to be sent beforehand since the bot can't message users who don't share a server with it.
+        await _send_dm(user, embed=embed)
 
         await user.ban(reason=reason, delete_message_days=0)
         log.info("Member %s has been banned from the server.", user)
 
-        await ctx.send(f"{user.mention} wurde gebannt. :do_not_litter:")
-
         modlog_embed = _build_modlog_embed("Server-Bann :do_not_litter:", color=const.EMBED_COLOR_MODLOG_BAN,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await asyncio.gather(ctx.send(f"{user.mention} wurde gebannt. :do_not_litter:"),
+                             _post_modlog_entry(modlog_embed))
 
     @commands.command(name='tempban', hidden=True)
     @command_log
@@ -583,21 +724,21 @@ class ModerationCog(commands.Cog):
         pretty_duration = get_pretty_string_duration(duration)
 
         embed = _build_mod_action_embed("TempBann", "Du wurdest durch **__{0}__** von **__{1}__** für {2} gebannt."
-                                        .format(prosecutor, self.bot.get_guild(int(const.SERVER_ID)),
-                                                pretty_duration), reason, self.ch_rules)
-        await user.send(embed=embed)
+                                        .format(prosecutor, self.guild,
+                                                pretty_duration), reason, self._mod_action_note)
+        await _send_dm(user, embed=embed)
 
         await user.ban(reason=reason, delete_message_days=0)
-        log.info("Member %s has been banned from the server until %s.", user, run_date.strftime("%d.%m.%Y %H:%M:%S"))
-
-        await ctx.send(f"{user.mention} wurde für {pretty_duration} gebannt. :do_not_litter:")
+        log.info("Member %s has been banned from the server until %s.", user, run_date.strftime(_END_DATE_FORMAT))
 
         modlog_embed = _build_modlog_embed("Temporärer Server-Bann :do_not_litter:",
                                            color=const.EMBED_COLOR_MODLOG_BAN,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await asyncio.gather(ctx.send(f"{user.mention} wurde für {pretty_duration} gebannt. :do_not_litter:"),
+                             _post_modlog_entry(modlog_embed))
 
-        singletons.SCHEDULER.add_job(_scheduled_unban_user, trigger="date", run_date=run_date, args=[user.id])
+        await asyncio.to_thread(singletons.SCHEDULER.add_job, _scheduled_unban_user, trigger="date",
+                                run_date=run_date, args=[user.id])
 
     @tempmute_user.error
     @tempban_user.error
@@ -626,18 +767,16 @@ class ModerationCog(commands.Cog):
             reason (Optional[str]): The reason provided by the moderator.
         """
         embed = _build_mod_action_embed("Kick", "Du wurdest durch **__{0}__** von **__{1}__** gekickt."
-                                        .format(ctx.author, self.bot.get_guild(int(const.SERVER_ID))),
-                                        reason, self.ch_rules)
-        await user.send(embed=embed)
+                                        .format(ctx.author, self.guild),
+                                        reason, self._mod_action_note)
+        await _send_dm(user, embed=embed)
 
         await user.kick(reason=reason)
         log.info("Member %s has been kicked from the server.", user)
 
-        await ctx.send(f"{user.mention} wurde gekickt. :anger:")
-
         modlog_embed = _build_modlog_embed("Server-Kick :anger:", color=const.EMBED_COLOR_MODLOG_KICK,
                                            moderator=ctx.author, user=user, reason=reason)
-        await self.ch_modlog.send(embed=modlog_embed)
+        await asyncio.gather(ctx.send(f"{user.mention} wurde gekickt. :anger:"), _post_modlog_entry(modlog_embed))
 
     @commands.command(name='namehistory', hidden=True, aliases=["aka"])
     @command_log
@@ -651,24 +790,23 @@ class ModerationCog(commands.Cog):
             ctx (discord.ext.commands.Context): The context in which the command was called.
             user (discord.Member): The member whose names are being requested.
         """
-        nicknames = self._db_connector.get_member_names(user.id)
-        description = "Es werden maximal die __letzten {0} Namen__ eines Mitglieds angezeigt, welche auf diesem " \
-                      "Server verwendet wurden." \
-            .format(const.LIMIT_NICKNAMES)
-
+        nicknames = await asyncio.to_thread(self._db_connector.get_member_names, user.id, const.LIMIT_NICKNAMES)
         if nicknames:
-            embed = discord.Embed(title=f"Namensverlauf von {user} :page_with_curl:", description=description,
-                                  color=const.EMBED_COLOR_MODERATION, timestamp=utils.utcnow())
-            embed.set_footer(text="Stand")
-            embed.set_thumbnail(url=user.display_avatar)
-            embed.add_field(name=user.display_name, value="aktuell")
+            now = utils.utcnow()
 
-            for name in nicknames[:const.LIMIT_NICKNAMES]:
-                timestamp = datetime.strptime(name[1], '%Y-%m-%d %H:%M:%S.%f%z')
-                str_time = timestamp.strftime("%d.%m.%Y\num *%X*")
-                embed.add_field(name=name[0], value=f"bis {str_time}")
+            def create_embed() -> discord.Embed:
+                embed = discord.Embed(title=f"Namensverlauf von {user} :page_with_curl:",
+                                      description=_NICKNAMES_DESCRIPTION, color=const.EMBED_COLOR_MODERATION,
+                                      timestamp=now)
+                embed.set_footer(text="Stand")
+                embed.set_thumbnail(url=user.display_avatar)
+                return embed
 
-            await ctx.send(embed=embed)
+            fields = chain([(user.display_name, "aktuell")],
+                           ((name, f"bis {date}\num *{time}*") for name, date, time in nicknames))
+
+            for embed in _paginate_fields(create_embed, fields):
+                await ctx.send(embed=embed)
         else:
             await ctx.send(f"**__{user}__** hatte bisher keinen anderen Namen auf diesem Server. "
                            ":face_with_monocle:")
@@ -688,18 +826,21 @@ class ModerationCog(commands.Cog):
         if amount > const.LIMIT_NEW_MEMBERS:
             raise commands.BadArgument("The amount of new members to be displayed is too big.")
 
-        members = sorted(ctx.guild.members, key=operator.attrgetter("joined_at"), reverse=True)[:amount]
-        description = "Füge an das Ende des Befehls eine beliebige Zahl an, um die Menge an neuen Mitgliedern " \
-                      "individuell festzulegen. **(max. {0})**".format(const.LIMIT_NEW_MEMBERS)
+        # Members which are still being chunked may not have a join date yet and are therefore left out.
+        members = heapq.nlargest(amount, (member for member in ctx.guild.members if member.joined_at),
+                                 key=lambda m: m.joined_at)
+        now = utils.utcnow()
 
-        embed = discord.Embed(title="Neueste Mitglieder :couple:", color=const.EMBED_COLOR_MODERATION,
-                              description=description, timestamp=utils.utcnow())
-        embed.set_footer(text="Stand")
+        def create_embed() -> discord.Embed:
+            embed = discord.Embed(title="Neueste Mitglieder :couple:", color=const.EMBED_COLOR_MODERATION,
+                                  description=_NEW_MEMBERS_DESCRIPTION, timestamp=now)
+            embed.set_footer(text="Stand")
+            return embed
 
-        for member in members:
-            embed.add_field(name=str(member), value=datetime.strftime(member.joined_at, "%d.%m.%Y | *%X*"))
+        fields = ((str(member), member.joined_at.strftime("%d.%m.%Y | *%X*")) for member in members)
 
-        await ctx.send(embed=embed)
+        for embed in _paginate_fields(create_embed, fields):
+            await ctx.send(embed=embed)
 
     @new_members.error
     async def new_members_error(self, ctx: commands.Context, error: commands.CommandError):
@@ -728,12 +869,9 @@ class ModerationCog(commands.Cog):
             ctx (discord.ext.commands.Context): The context in which the command was called.
             user (discord.Member): The member whose avatar is being requested.
         """
-        description = "[.jpg]({0}) | [.png]({1}) | [.webp]({2})".format(user.avatar.replace(format="jpg"),
-                                                                        user.avatar.replace(format="png"),
-                                                                        user.avatar.replace(format="webp"))
-
-        if user.avatar.is_animated():
-            description += " | [.gif]({0})".format(user.avatar.replace(format="gif"))
+        avatar = user.avatar
+        formats = ("jpg", "png", "webp", "gif") if avatar.is_animated() else ("jpg", "png", "webp")
+        description = " | ".join(f"[.{fmt}]({avatar.replace(format=fmt)})" for fmt in formats)
 
         embed = discord.Embed(title=f"Avatar von {user}", color=const.EMBED_COLOR_MODERATION,
                               timestamp=utils.utcnow(), description=description)
@@ -756,11 +894,8 @@ class ModerationCog(commands.Cog):
         """
         created_at = datetime.strftime(user.created_at, "%d.%m.%Y | %X")
         joined_at = datetime.strftime(user.joined_at, "%d.%m.%Y | %X")
-        roles = " ".join([role.mention for role in reversed(user.roles[1:])]) if len(user.roles) > 1 else "\U0000274C" \
-                                                                                                          " - Keine."
-        num_total_roles = len(user.roles)
-        if len(roles) > 1024:
-            roles = _trim_role_string(roles, num_total_roles)
+        user_roles = user.roles  # Member.roles builds a new sorted list on every access.
+        roles = _build_role_string(user_roles[:0:-1]) if len(user_roles) > 1 else "\U0000274C - Keine."
 
         description = f"**Name am Server:** {user.display_name} | {user.mention}"
 
@@ -800,7 +935,7 @@ class ModerationCog(commands.Cog):
             error (commands.CommandError): The error raised during the execution of the command.
         """
         if isinstance(error, commands.BadArgument):
-            regex = re.search(r"\"(.*)\"", error.args[0])  # Regex for getting text between two quotes.
+            regex = _DOUBLE_QUOTED_TEXT.search(error.args[0])
             user = regex.group(1) if regex else None
 
             await ctx.send(f"**__Error:__** Ich konnte leider keinen Nutzer namens **{user}** finden. :confused: "
@@ -822,7 +957,7 @@ class ModerationCog(commands.Cog):
             offender (discord.Member): The person accused of doing something wrong.
             description (str): A description of why this person has been reported.
         """
-        if not self._db_connector.is_botonly(ctx.channel.id):
+        if not await asyncio.to_thread(self._db_connector.is_botonly, ctx.channel.id):
             await ctx.message.delete()
 
         embed = _create_report_embed(offender, ctx.author, ctx.channel, ctx.message, description)
@@ -843,7 +978,7 @@ class ModerationCog(commands.Cog):
         await ctx.message.delete()
 
         if isinstance(error, commands.BadArgument):
-            regex = re.search(r"\"(.*)\"", error.args[0])  # Regex for getting text between two quotes.
+            regex = _DOUBLE_QUOTED_TEXT.search(error.args[0])
             user = regex.group(1) if regex else None
 
             await ctx.author.send(f"Ich konnte leider keinen Nutzer namens **{user}** finden. :confused: Hast du dich "
@@ -872,19 +1007,24 @@ class ModerationCog(commands.Cog):
 
         confirmation_embed = _build_purge_confirmation_embed(purge_channel, amount)
         is_confirmed = await self._send_confirmation_dialog(ctx, confirmation_embed)
-        is_posted_in_purge_channel = purge_channel is ctx.channel
         if is_confirmed:
-            deleted_messages = await purge_channel.purge(limit=amount + 1 if is_posted_in_purge_channel else amount)
-            deleted_messages_count = len(deleted_messages)-1 if is_posted_in_purge_channel else len(deleted_messages)
-            await purge_channel.send(
-                '**Ich habe __{0} Nachrichten__ erfolgreich gelöscht.**'.format(deleted_messages_count),
-                delete_after=const.TIMEOUT_INFORMATION)
+            # The invocation is removed beforehand so that it doesn't count towards the messages which should be purged.
+            if purge_channel is ctx.channel:
+                await ctx.message.delete()
+
+            # Uses the bulk-delete endpoint (up to 100 messages per request). discord.py automatically falls back to
+            # deleting messages individually for those older than 14 days, which can't be bulk-deleted.
+            deleted_messages = await purge_channel.purge(limit=amount, bulk=True)
+            deleted_messages_count = len(deleted_messages)
             log.info("SAM deleted %s messages in [#%s]", deleted_messages_count, purge_channel)
 
             details = f"Deleted {deleted_messages_count} messages in channel {purge_channel.mention}"
             embed = _build_modlog_embed("Purge", color=const.EMBED_COLOR_MODLOG_PURGE,
                                         moderator=ctx.author, user=None, reason=None, details=details)
-            await self.ch_modlog.send(embed=embed)
+            await asyncio.gather(
+                purge_channel.send('**Ich habe __{0} Nachrichten__ erfolgreich gelöscht.**'
+                                   .format(deleted_messages_count), delete_after=const.TIMEOUT_INFORMATION),
+                _post_modlog_entry(embed))
 
     @purge_messages.error
     async def purge_messages_error(self, ctx: commands.Context, error: commands.CommandError):
@@ -917,37 +1057,38 @@ class ModerationCog(commands.Cog):
             message (str): The message which should be send to the moderators.
         """
         if ctx.channel.type not in [discord.ChannelType.private, discord.ChannelType.group] \
-                and not self._db_connector.is_botonly(ctx.channel.id):
+                and not await asyncio.to_thread(self._db_connector.is_botonly, ctx.channel.id):
             await ctx.message.delete()
 
         msg_author_name = str(ctx.message.author)
         msg_timestamp = ctx.message.created_at
 
-        image = next((a for a in ctx.message.attachments if a.filename.split(".")[-1].lower()
-                      in ["jpg", "jpeg", "png", "gif"]), None)
-        files = [await a.to_file() for a in ctx.message.attachments if a != image]
+        # The first image is shown in the embed, every other attachment is uploaded alongside it.
+        image = None
+        other_attachments = []
+        for attachment in ctx.message.attachments:
+            if image is None and attachment.filename.rpartition(".")[2].lower() in _IMAGE_EXTENSIONS:
+                image = attachment
+            else:
+                other_attachments.append(attachment)
 
-        embed = discord.Embed(title="Status: Offen", color=const.EMBED_COLOR_MODMAIL_OPEN,
-                              timestamp=utils.utcnow(), description=message)
-        embed.set_author(name=str(ctx.author), icon_url=ctx.author.display_avatar)
-        embed.set_footer(text="Erhalten am")
+        files = await asyncio.gather(*[attachment.to_file() for attachment in other_attachments])
 
-        if image:
-            embed.set_image(url=image.url)
+        image_url = image.url if image else None
+        embed = _build_modmail_embed(*_MODMAIL_STATUS_EMBED[ModmailStatus.OPEN], ctx.author, message, image_url,
+                                     msg_timestamp)
 
         msg_modmail = await self.ch_modmail.send(embed=embed, files=files)
-        self._db_connector.add_modmail(msg_modmail.id, msg_author_name, msg_timestamp)
+        await asyncio.to_thread(self._db_connector.add_modmail, msg_modmail.id, msg_author_name, msg_timestamp)
         log.info("Member %s submitted a modmail.", ctx.author)
 
-        await msg_modmail.add_reaction(const.EMOJI_MODMAIL_DONE)
-        await msg_modmail.add_reaction(const.EMOJI_MODMAIL_ASSIGN)
+        embed_confirmation = _build_modmail_embed("Deine Nachricht:", const.EMBED_COLOR_INFO, ctx.author, message,
+                                                  image_url, msg_timestamp)
 
-        embed_confirmation = embed.to_dict()
-        embed_confirmation["title"] = "Deine Nachricht:"
-        embed_confirmation["color"] = const.EMBED_COLOR_INFO
-        embed_confirmation = discord.Embed.from_dict(embed_confirmation)
-        await ctx.author.send("Deine Nachricht wurde erfolgreich an die Moderatoren weitergeleitet!\n"
-                              "__Hier deine Bestätigung:__", embed=embed_confirmation)
+        await asyncio.gather(msg_modmail.add_reaction(const.EMOJI_MODMAIL_DONE),
+                             msg_modmail.add_reaction(const.EMOJI_MODMAIL_ASSIGN),
+                             ctx.author.send("Deine Nachricht wurde erfolgreich an die Moderatoren weitergeleitet!\n"
+                                             "__Hier deine Bestätigung:__", embed=embed_confirmation))
 
     @modmail.command(name='get')
     @command_log
@@ -963,7 +1104,7 @@ class ModerationCog(commands.Cog):
             status (str): The status specified by the moderator.
         """
         if ctx.channel.id != self.ch_modmail.id:
-            if not self._db_connector.is_botonly(ctx.channel.id):
+            if not await asyncio.to_thread(self._db_connector.is_botonly, ctx.channel.id):
                 await ctx.message.delete()
 
             await ctx.author.send(f"Dieser Befehl wird nur in {self.ch_modmail.mention} unterstützt. Bitte "
@@ -971,7 +1112,7 @@ class ModerationCog(commands.Cog):
             return
 
         enum_status = ModmailStatus[status.upper()]
-        modmail = self._db_connector.get_all_modmail_with_status(enum_status)
+        modmail = await asyncio.to_thread(self._db_connector.get_all_modmail_with_status, enum_status)
 
         embed = _modmail_create_list_embed(enum_status, modmail)
         await self.ch_modmail.send(embed=embed)
@@ -993,7 +1134,7 @@ class ModerationCog(commands.Cog):
                                            .format(error.original.args[0].title()))
 
             elif isinstance(error.original, ValueError):
-                regex = re.search(r"\'(.*)\'", error.args[0])  # Regex for getting text between two quotes.
+                regex = _SINGLE_QUOTED_TEXT.search(error.args[0])
                 status = regex.group(1) if regex else None
 
                 await self.ch_modmail.send(f"**__Error:__** Nicht unterstützter Modmail-Status `{status}`.")
@@ -1009,16 +1150,24 @@ class ModerationCog(commands.Cog):
         Args:
             payload (discord.RawReactionActionEvent): The payload for the triggered event.
         """
-        if payload.channel_id == self.ch_modmail.id and not payload.member.bot:
-            modmail = await self.ch_modmail.fetch_message(payload.message_id)
-            reaction = next(x for x in modmail.reactions if x.emoji == payload.emoji.name)
-
-            if payload.emoji.name in (const.EMOJI_MODMAIL_DONE, const.EMOJI_MODMAIL_ASSIGN) \
-                    and reaction.count <= 2:
-                new_embed = await self.change_modmail_status(modmail, payload.emoji.name, True)
-                await modmail.edit(embed=new_embed)
-            else:
-                await reaction.remove(payload.member)
+        if payload.channel_id != self.ch_modmail.id or payload.member.bot:
+            return
+
+        # Other reactions can be removed right away without having to fetch the whole message first.
+        if payload.emoji.name not in _MODMAIL_EMOJIS:
+            await self.ch_modmail.get_partial_message(payload.message_id).remove_reaction(payload.emoji,
+                                                                                          payload.member)
+            return
+
+        modmail = await self._get_modmail(payload.message_id)
+        reaction = utils.get(modmail.reactions, emoji=payload.emoji.name)
+        if reaction is None:
+            return
+
+        if reaction.count <= 2:
+            await self.change_modmail_status(modmail, payload.emoji.name, True)
+        else:
+            await reaction.remove(payload.member)
 
     @commands.Cog.listener(name='on_raw_reaction_remove')
     async def modmail_reaction_remove(self, payload: discord.RawReactionActionEvent):
@@ -1031,15 +1180,43 @@ class ModerationCog(commands.Cog):
         Args:
             payload (discord.RawReactionActionEvent): The payload for the triggered event.
         """
-        if payload.channel_id == self.ch_modmail.id:
-            modmail = await self.ch_modmail.fetch_message(payload.message_id)
+        if payload.channel_id != self.ch_modmail.id or payload.emoji.name not in _MODMAIL_EMOJIS:
+            return
+
+        modmail = await self._get_modmail(payload.message_id)
+        reaction = utils.get(modmail.reactions, emoji=payload.emoji.name)
+
+        if reaction is None or reaction.count <= 1:
+            await self.change_modmail_status(modmail, payload.emoji.name, False)
+
+    async def _get_modmail(self, message_id: int) -> discord.Message:
+        """Returns the modmail with the given message id.
+
+        The message cache of discord.py is kept up to date with the reactions and edits of cached messages, which means
+        that the modmail only has to be fetched from Discord if it isn't cached (anymore).
 
-            if payload.emoji.name in (const.EMOJI_MODMAIL_DONE, const.EMOJI_MODMAIL_ASSIGN) \
-                    and next(x for x in modmail.reactions if x.emoji == payload.emoji.name).count <= 1:
-                new_embed = await self.change_modmail_status(modmail, payload.emoji.name, False)
-                await modmail.edit(embed=new_embed)
+        If the modmail is already being fetched, the pending request will be awaited instead of fetching it once more.
 
-    async def check_warnings(self, ctx: commands.Context, user: discord.Member, was_warning_added: bool = True):
+        Args:
+            message_id (int): The message id of the modmail.
+
+        Returns:
+            (discord.Message): The Discord message in the specified modmail channel.
+        """
+        modmail = utils.get(self.bot.cached_messages, id=message_id)
+        if modmail:
+            return modmail
+
+        fetch = self._modmail_fetches.get(message_id)
+        if fetch is None:
+            fetch = asyncio.create_task(self.ch_modmail.fetch_message(message_id))
+            fetch.add_done_callback(lambda _: self._modmail_fetches.pop(message_id, None))
+            self._modmail_fetches[message_id] = fetch
+
+        return await asyncio.shield(fetch)
+
+    async def check_warnings(self, ctx: commands.Context, user: discord.Member, was_warning_added: bool = True,
+                             removed_warnings: int = 1):
         """Method which checks the amount of warnings a user has and punishes him if necessary. It also creates/updates
         scheduler jobs to remove them after some time.
 
@@ -1053,81 +1230,161 @@ class ModerationCog(commands.Cog):
             ctx (discord.ext.commands.Context): The context in which the command was called.
             user (discord.Member): The member which has been warned.
             was_warning_added (bool): Specifies if a warning has been added or not to prevent that a user gets punished multiple times.
+            removed_warnings (int): The amount of warnings which have been removed since the last check, if no warning
+                                    has been added.
         """
-        warnings = self._db_connector.get_member_warnings(user.id)
+        warnings = await asyncio.to_thread(self._db_connector.get_member_warnings, user.id)
         cntr_warnings = len(warnings) if warnings else 0
-        punishments = {
-            const.LIMIT_WARNINGS_LVL_1:      ("tempmute", "1 week"),
-            const.LIMIT_WARNINGS_LVL_2:      ("tempban", "2 weeks"),
-            const.LIMIT_WARNINGS_LVL_3:      ("ban", None)
-        }
 
         if cntr_warnings != 0:
             # Punishment
-            if was_warning_added and (cntr_warnings in punishments):
-                punishment = punishments[cntr_warnings]
+            if was_warning_added and (cntr_warnings in self._warning_punishments):
+                punishment = self._warning_punishments[cntr_warnings]
                 reason = f"Automatisch durchgeführte Aktion aufgrund von insgesamt {cntr_warnings} Verwarnungen."
 
                 if punishment[1]:
-                    await ctx.invoke(self.bot.get_command(punishment[0]), user=user, duration=punishment[1], reason=reason,
-                                     bot_activated=True)
+                    await ctx.invoke(punishment[0], user=user, duration=punishment[1], reason=reason, bot_activated=True)
                 else:
-                    await ctx.invoke(self.bot.get_command(punishment[0]), user=user, reason=reason, bot_activated=True)
+                    await ctx.invoke(punishment[0], user=user, reason=reason, bot_activated=True)
 
             # Expiration Date
-            weeks = (cntr_warnings + 1) * 4 if cntr_warnings > 1 else 4
+            weeks = _get_warning_expiration_weeks(cntr_warnings)
             run_date = get_future_timestamp("{0}w".format(weeks))
 
             if not was_warning_added:
-                expiration_job = singletons.SCHEDULER.get_job(f"warns_expire_{user.id}")
-                run_date = expiration_job.next_run_time - timedelta(weeks=(((cntr_warnings + 2) * 4) - weeks))
-
-            singletons.SCHEDULER.add_job(_scheduled_clear_warnings, trigger="date", run_date=run_date, args=[user.id],
-                                         id=f"warns_expire_{user.id}", replace_existing=True)
+                expiration_job = await asyncio.to_thread(singletons.SCHEDULER.get_job, f"warns_expire_{user.id}")
+                if expiration_job:
+                    previous_weeks = _get_warning_expiration_weeks(cntr_warnings + removed_warnings)
+                    run_date = expiration_job.next_run_time - timedelta(weeks=previous_weeks - weeks)
+
+            await asyncio.to_thread(singletons.SCHEDULER.add_job, _scheduled_clear_warnings, trigger="date",
+                                    run_date=run_date, args=[user.id], id=f"warns_expire_{user.id}",
+                                    replace_existing=True)
         else:
             # Remove scheduler job from DB because it isn't needed anymore
-            singletons.SCHEDULER.get_job(f"warns_expire_{user.id}").remove()
+            await asyncio.to_thread(_remove_scheduler_job, f"warns_expire_{user.id}")
+
+    async def _check_warnings_after_removal(self, user_id: int):
+        """Checks the warnings of a member after a short delay once some of them have been removed.
+
+        Further removals of warnings of the same member during the delay restart it, so that the expiration date only
+        gets recalculated once for all of them.
+
+        Args:
+            user_id (int): The id of the member whose warnings have been removed.
+        """
+        await asyncio.sleep(const.DELAY_WARNING_CHECK)
+
+        del self._warning_checks[user_id]
+        await self._run_warning_check(*self._removed_warnings.pop(user_id))
+
+    def _cancel_warning_check(self, user_id: int) -> Optional[Tuple[commands.Context, discord.Member, int]]:
+        """Cancels the pending check of the warnings of a member, if there is one.
+
+        Args:
+            user_id (int): The id of the member whose warnings have been removed.
+
+        Returns:
+            Optional[Tuple[commands.Context, discord.Member, int]]: The context of the last removal, the member and the
+            amount of removed warnings of the cancelled check or None, if no check has been pending.
+        """
+        pending_check = self._warning_checks.pop(user_id, None)
+        if pending_check:
+            pending_check.cancel()
+        return self._removed_warnings.pop(user_id, None)
+
+    async def _run_warning_check(self, ctx: commands.Context, user: discord.Member, removed_warnings: int):
+        """Checks the warnings of a member after some of them have been removed and logs any error which occurs.
+
+        Args:
+            ctx (discord.ext.commands.Context): The context in which the last warning has been removed.
+            user (discord.Member): The member whose warnings have been removed.
+            removed_warnings (int): The amount of warnings which have been removed.
+        """
+        try:
+            await self.check_warnings(ctx, user, False, removed_warnings)
+        except Exception as error:  # pylint: disable=broad-except
+            log.error("The warnings of %s couldn't be checked after %s of them have been removed: %s", user,
+                      removed_warnings, error)
+
+    async def _process_modlog_entries(self):
+        """Worker which posts the queued embeds in the modlog channel.
+
+        Waits for an embed in the queue of modlog entries and posts it right away. If further entries are already queued
+        (e.g. during a raid), more of them are collected for a few seconds before posting all of them in a single
+        message, unless enough entries for a whole message are queued anyway.
+        """
+        while True:
+            self._modlog_batch = [await ModerationCog.modlog_queue.get()]
+            if 0 < ModerationCog.modlog_queue.qsize() < const.LIMIT_EMBEDS_PER_MESSAGE - 1:
+                await asyncio.sleep(const.DELAY_MODLOG_BATCH)
+            _get_queued_items(ModerationCog.modlog_queue, self._modlog_batch, const.LIMIT_EMBEDS_PER_MESSAGE)
+
+            try:
+                for embeds in list(_group_embeds(self._modlog_batch)):
+                    try:
+                        await self.ch_modlog.send(embeds=embeds)
+                    except discord.HTTPException as error:
+                        log.error("%s modlog entries couldn't be posted: %s", len(embeds), error)
+                    del self._modlog_batch[:len(embeds)]
+            except Exception as error:  # pylint: disable=broad-except
+                log.error("%s modlog entries couldn't be posted: %s", len(self._modlog_batch), error)
+                self._modlog_batch = []
+
+    async def _flush_modmail_status(self):
+        """Writes the pending status changes of modmail to the database after a short delay.
+
+        Every status change happening in the meantime is collected as well, which means that only the final status of
+        each modmail is written to the database.
+        """
+        await asyncio.sleep(const.DELAY_MODMAIL_STATUS_FLUSH)
+
+        pending, self._pending_modmail_status = self._pending_modmail_status, {}
+        self._modmail_status_flush = None
+        await asyncio.to_thread(self._db_connector.change_modmail_statuses, pending)
 
-    async def change_modmail_status(self, modmail: discord.Message, emoji: str, reaction_added: bool) -> discord.Embed:
+    async def change_modmail_status(self, modmail: discord.Message, emoji: str, reaction_added: bool):
         """Method which changes the status of a modmail depending on the given emoji.
 
         This is done by changing the StatusID in the database for the respective message and visualized by changing the
-        color of the Embed posted on Discord.
+        color of the Embed posted on Discord. Since the color reflects the current status, it's also used to check if
+        the status actually changes without having to query the database. The status in the database is only changed
+        once the embed has been edited successfully.
 
         Args:
             modmail (discord.Message): The Discord message in the specified modmail channel.
             emoji (str): A String containing the Unicode for a specific emoji.
             reaction_added (Boolean): A boolean indicating if a reaction has been added or removed.
-
-        Returns:
-            discord.Embed: An adapted Embed corresponding to the new modmail status.
         """
-        dict_embed = modmail.embeds[0].to_dict()
-        dict_embed["title"] = "Status: "
-
         if reaction_added and emoji == const.EMOJI_MODMAIL_DONE:
-            await modmail.clear_reaction(const.EMOJI_MODMAIL_ASSIGN)
-            self._db_connector.change_modmail_status(modmail.id, ModmailStatus.CLOSED)
-            dict_embed["title"] += "Erledigt"
-            dict_embed["color"] = const.EMBED_COLOR_MODMAIL_CLOSED
+            status = ModmailStatus.CLOSED
         elif reaction_added and emoji == const.EMOJI_MODMAIL_ASSIGN:
-            self._db_connector.change_modmail_status(modmail.id, ModmailStatus.ASSIGNED)
-            dict_embed["title"] += "In Bearbeitung"
-            dict_embed["color"] = const.EMBED_COLOR_MODMAIL_ASSIGNED
+            status = ModmailStatus.ASSIGNED
         else:
-            self._db_connector.change_modmail_status(modmail.id, ModmailStatus.OPEN)
-            dict_embed["title"] += "Offen"
-            dict_embed["color"] = const.EMBED_COLOR_MODMAIL_OPEN
+            status = ModmailStatus.OPEN
 
-            if emoji == const.EMOJI_MODMAIL_DONE:
-                await modmail.add_reaction(const.EMOJI_MODMAIL_ASSIGN)
+        embed = modmail.embeds[0]
+        if embed.colour and _MODMAIL_STATUS_BY_COLOR.get(embed.colour.value) == status:
+            return
+
+        # The embed of the cached message mustn't be changed in case the edit fails.
+        embed = embed.copy()
+        embed.title, embed.colour = _MODMAIL_STATUS_EMBED[status]
+        await modmail.edit(embed=embed)
 
-        return discord.Embed.from_dict(dict_embed)
+        self._pending_modmail_status[modmail.id] = status
+        if self._modmail_status_flush is None:
+            self._modmail_status_flush = asyncio.create_task(self._flush_modmail_status())
+
+        if status == ModmailStatus.CLOSED:
+            await modmail.clear_reaction(const.EMOJI_MODMAIL_ASSIGN)
+        elif status == ModmailStatus.OPEN and emoji == const.EMOJI_MODMAIL_DONE:
+            await modmail.add_reaction(const.EMOJI_MODMAIL_ASSIGN)
 
     async def _send_confirmation_dialog(self, ctx: commands.Context, embed: discord.Embed) -> bool:
         """Posts a confirmation dialog and returns the users answer.
 
-        Posts an embed and adds reactions for confirmation and cancellation to it. A bool indicating if the user has
+        Posts an embed along with buttons for confirmation and cancellation. A bool indicating if the user has
         confirmed or aborted the operation will be returned. Regardless of the return value the embed will be deleted
         shortly after.
 
@@ -1139,22 +1396,24 @@ class ModerationCog(commands.Cog):
         Returns:
             (bool):A bool representing the users decision.
         """
-        message = await ctx.send(embed=embed, delete_after=const.TIMEOUT_USER_SELECTION)
-        await message.add_reaction(const.EMOJI_CONFIRM)
-        await message.add_reaction(const.EMOJI_CANCEL)
+        view = ConfirmationView(ctx.author, timeout=const.TIMEOUT_USER_SELECTION)
+        message = await ctx.send(embed=embed, view=view)
 
-        def check_reaction(_reaction, user):
-            return user == ctx.author and _reaction.message.id == message.id and \
-                   str(_reaction.emoji) in [const.EMOJI_CANCEL, const.EMOJI_CONFIRM]
+        has_timed_out = await view.wait()
+        if has_timed_out:
+            await message.delete()
+            raise asyncio.TimeoutError
 
-        reaction = await self.bot.wait_for('reaction_add', timeout=const.TIMEOUT_USER_SELECTION,
-                                           check=check_reaction)
-        await message.delete()
+        is_confirmed = view.is_confirmed
 
-        if str(reaction[0].emoji) == const.EMOJI_CANCEL:
-            await ctx.message.delete()
+        # The dialog needs to be gone before returning since it might otherwise be affected by the confirmed operation
+        # (e.g. a purge in the same channel).
+        if is_confirmed:
+            await message.delete()
+        else:
+            await asyncio.gather(message.delete(), ctx.message.delete())
 
-        return str(reaction[0].emoji) == const.EMOJI_CONFIRM
+        return is_confirmed
 
     @commands.Cog.listener(name='on_member_update')
     @commands.Cog.listener(name='on_user_update')
@@ -1169,7 +1428,9 @@ class ModerationCog(commands.Cog):
             after (discord.Member): The new member object after the update.
         """
         if before.display_name != after.display_name:
-            self._db_connector.add_member_name(before.id, before.display_name, utils.utcnow())
+            # Member updates can arrive in bursts, so the write shouldn't block the event loop in the meantime.
+            await asyncio.to_thread(self._db_connector.add_member_name, before.id, before.display_name,
+                                    utils.utcnow())
 
 
 async def _scheduled_unmute_user(user_id: int):
@@ -1182,47 +1443,55 @@ async def _scheduled_unmute_user(user_id: int):
         user_id (int): The id of the user who should be unmuted.
     """
     guild = ModerationCog.bot.get_guild(int(const.SERVER_ID))
-    user = guild.get_member(int(user_id))
+    user = guild.get_member(int(user_id)) or await guild.fetch_member(int(user_id))
     role = guild.get_role(int(const.ROLE_ID_MUTED))
     ch_rules = guild.get_channel(int(const.CHANNEL_ID_RULES))
-    ch_modlog = guild.get_channel(int(const.CHANNEL_ID_MODLOG))
 
-    await user.remove_roles(role, reason="Die für den Tempmute festgelegte Zeitdauer ist ausgelaufen.")
-    await user.send(f"Hey, {user.display_name}! :wave:\nDu bist nicht mehr stummgeschalten! :speaker: Versuch "
-                    f"bitte, dich in Zukunft besser an unsere {ch_rules.mention} zu halten, da wir ansonsten "
-                    f"gezwungen sind, härtere Strafen zu verhängen. :scales:")
+    await asyncio.gather(user.remove_roles(role, reason="Die für den Tempmute festgelegte Zeitdauer ist ausgelaufen."),
+                         _send_dm(user, _UNMUTE_DM.format(name=user.display_name, rules=ch_rules.mention)))
 
     modlog_embed = _build_modlog_embed("Aufhebung: Temporäre Stummschaltung :speaker:",
                                        color=const.EMBED_COLOR_MODLOG_REPEAL, moderator=ModerationCog.bot.user,
                                        user=user, reason="Automatisch durchgeführte Aktion, da die spezifizierte Dauer "
                                                          "abgelaufen ist.")
-    await ch_modlog.send(embed=modlog_embed)
+    await _post_modlog_entry(modlog_embed)
 
 
 async def _scheduled_unban_user(user_id: int):
     """Method which is being called by the scheduler if the specified amount of time for the corresponding tempban has
     ran out.
 
-    Unbans a user with the specified ID on a specific server.
+    Only a limited amount of users are unbanned concurrently. The rate limits imposed by Discord are being handled by
+    discord.py itself.
+
+    Args:
+        user_id (int): The id of the user who should be unbanned.
+    """
+    async with ModerationCog.unban_semaphore:
+        try:
+            await _unban_user(int(user_id))
+        except discord.HTTPException as error:
+            log.error("User with ID %s couldn't be unbanned: %s", user_id, error)
+
+
+async def _unban_user(user_id: int):
+    """Unbans a user with the specified ID on a specific server after his tempban has run out.
 
     Args:
         user_id (int): The id of the user who should be unbanned.
     """
     guild = ModerationCog.bot.get_guild(int(const.SERVER_ID))
-    user = await ModerationCog.bot.fetch_user(int(user_id))
+    user = ModerationCog.bot.get_user(user_id) or await ModerationCog.bot.fetch_user(user_id)
     ch_rules = guild.get_channel(int(const.CHANNEL_ID_RULES))
-    ch_modlog = guild.get_channel(int(const.CHANNEL_ID_MODLOG))
 
-    await user.unban(reason="Die für den Tempban festgelegte Zeitdauer ist ausgelaufen.")
-    await user.send(f"Hey, {user.display_name}! :wave:\nDu bist nicht mehr von **__{guild}__** gebannt! :unlock: "
-                    f"Versuch bitte, dich in Zukunft besser an unsere {ch_rules.mention} zu halten, da wir ansonsten "
-                    f"gezwungen sind, dich dauerhaft zu bannen. :scales:")
+    await asyncio.gather(guild.unban(user, reason="Die für den Tempban festgelegte Zeitdauer ist ausgelaufen."),
+                         _send_dm(user, _UNBAN_DM.format(name=user.display_name, guild=guild, rules=ch_rules.mention)))
 
     modlog_embed = _build_modlog_embed("Aufhebung: Temporärer Server-Bann", color=const.EMBED_COLOR_MODLOG_REPEAL,
                                        moderator=ModerationCog.bot.user, user=user,
                                        reason="Automatisch durchgeführte Aktion, da die spezifizierte Dauer abgelaufen "
                                               "ist.")
-    await ch_modlog.send(embed=modlog_embed)
+    await _post_modlog_entry(modlog_embed)
 
 
 async def _scheduled_clear_warnings(user_id: int):
@@ -1234,106 +1503,135 @@ async def _scheduled_clear_warnings(user_id: int):
         user_id (int): The id of the user whose warnings should be removed.
     """
     guild = ModerationCog.bot.get_guild(int(const.SERVER_ID))
-    user = guild.get_member(int(user_id))
-    ch_modlog = guild.get_channel(int(const.CHANNEL_ID_MODLOG))
+    user = guild.get_member(int(user_id)) or await ModerationCog.bot.fetch_user(int(user_id))
 
-    ModerationCog.db_connector.remove_member_warnings(user.id)
+    await asyncio.to_thread(ModerationCog.db_connector.remove_member_warnings, user.id)
     log.info("All warnings have been removed from %s.", user)
 
     modlog_embed = _build_modlog_embed("Aufhebung: Alle Verwarnungen", color=const.EMBED_COLOR_MODLOG_REPEAL,
                                        moderator=ModerationCog.bot.user, user=user,
                                        reason="Automatisch durchgeführte Aktion, da die spezifizierte Dauer abgelaufen "
                                               "ist.")
-    await ch_modlog.send(embed=modlog_embed)
+    await _post_modlog_entry(modlog_embed)
 
 
-def _build_modlog_embed(action: str, color: discord.Colour, moderator: Union[discord.Member, discord.ClientUser],
-                        user: Optional[discord.Member], reason: Optional[str],
-                        details: Optional[str] = None) -> discord.Embed:
-    """Creates an embed which gets posted in the configured modlog channel.
+def _remove_scheduler_job(job_id: str):
+    """Removes the scheduler job with the specified id from the job store, if it exists.
 
-     The embed serves as an information for other moderators about what happend on the server and is therefore in
-     general nothing more than a simple log message. It contains the moderator who performed the action, the affected
-     member (if any) and the optional reason provided by said moderator why this has happened, as well as optional
-     details about the incident.
+    Args:
+        job_id (str): The id of the scheduler job.
+    """
+    job = singletons.SCHEDULER.get_job(job_id)
+    if job:
+        job.remove()
+
+
+def _get_warning_expiration_weeks(cntr_warnings: int) -> int:
+    """Calculates the amount of weeks after which the warnings of a member expire.
+
+    Args:
+        cntr_warnings (int): The amount of warnings the member has received.
 
     Returns:
-        (discord.Embed): The info embed.
+        int: The amount of weeks until the warnings expire.
     """
-    description = f"**Betroffener:** {user}\n" if user else ""
-    description += f"**Moderator:** {moderator}"
-    if reason:
-        description += f"\n**Begründung:** {reason}"
-    if details:
-        description += f"\n**Details:** {details}"
+    return (cntr_warnings + 1) * 4 if cntr_warnings > 1 else 4
 
-    return discord.Embed(title=action, color=color, description=description)
 
+async def _send_dm(user: Union[discord.Member, discord.User], content: Optional[str] = None,
+                   embed: Optional[discord.Embed] = None):
+    """Sends a direct message to a user and logs a warning if it couldn't be delivered.
 
-def _build_lockdown_embed() -> discord.Embed:
-    """Creates an embed which informs members that the current channel has been locked down.
+    Users might not accept direct messages, which shouldn't prevent a mod action from being completed and logged.
 
-    Returns:
-        (discord.Embed): The info embed.
+    Args:
+        user (Union[discord.Member, discord.User]): The user who should receive the message.
+        content (Optional[str]): The content of the message.
+        embed (Optional[discord.Embed]): An embed which should be attached to the message.
     """
-    description = "Dieser Kanal befindet sich aufgrund von Unruhen derzeit im Lockdown, weswegen das Versenden " \
-                  "von Nachrichten vorübergehend nicht möglich ist. :mailbox_with_no_mail:\n\nDie Moderatoren sind " \
-                  "bemüht, die Ordnung schnellstmöglich wiederherzustellen. Bitte haltet davon ab, sie bezüglich der " \
-                  "aktuellen Situation zu kontaktieren, da dies die Wiedereröffnung des Kanals nur unnötig verzögern " \
-                  "würde.\n\n**__Wir bitten um Verständnis.__ :heart:**"
+    try:
+        await user.send(content, embed=embed)
+    except discord.HTTPException as error:
+        log.warning("Direct message to %s couldn't be delivered: %s", user, error)
 
-    embed = discord.Embed(title=":rotating_light: LOCKDOWN :rotating_light:", color=const.EMBED_COLOR_WARNING,
-                          description=description)
 
-    return embed
+async def _post_modlog_entry(embed: discord.Embed):
+    """Passes an embed on to the queue of modlog entries, which is being processed by the moderation cog.
+
+    Moderation actions never wait for the modlog, which is why the entry is dropped if the queue is full.
+
+    Args:
+        embed (discord.Embed): The embed which should be posted in the modlog channel.
+    """
+    try:
+        ModerationCog.modlog_queue.put_nowait(embed)
+    except asyncio.QueueFull:
+        log.error("The modlog entry \"%s\" couldn't be queued because the queue is full.", embed.title)
+
 
+def _get_queued_items(queue: asyncio.Queue, items: list, limit: int) -> list:
+    """Removes items from a queue without waiting and appends them to a list until it has reached the given length.
 
-def _build_server_lockdown_embed() -> discord.Embed:
-    """Creates an embed which informs members that the whole server has been locked down.
+    Args:
+        queue (asyncio.Queue): The queue from which the items should be taken.
+        items (list): The list to which the items should be appended.
+        limit (int): The maximum length of the list.
 
     Returns:
-        (discord.Embed): The info embed.
+        list: The list containing the items.
     """
-    description = "Der gesamte Server befindet sich aufgrund von Unruhen derzeit im Lockdown, weswegen das Versenden " \
-                  "von Nachrichten vorübergehend nicht möglich ist. :mailbox_with_no_mail:\n\nDie Moderatoren sind " \
-                  "bemüht, die Ordnung schnellstmöglich wiederherzustellen. Bitte haltet davon ab, sie bezüglich der " \
-                  "aktuellen Situation zu kontaktieren, da dies die Wiedereröffnung des Kanals nur unnötig verzögern " \
-                  "würde.\n\n**__Wir bitten um Verständnis.__ :heart:**"
-
-    embed = discord.Embed(title=":rotating_light: LOCKDOWN :rotating_light:", color=const.EMBED_COLOR_WARNING,
-                          description=description)
+    while len(items) < limit and not queue.empty():
+        items.append(queue.get_nowait())
+    return items
 
-    return embed
 
+def _group_embeds(embeds: List[discord.Embed]) -> Iterator[List[discord.Embed]]:
+    """Splits a list of embeds into groups which can be posted in a single message each.
 
-def _build_lockdown_lift_embed() -> discord.Embed:
-    """Creates an embed which informs members that the lockdown in a specific channel has been lifted.
+    Args:
+        embeds (List[discord.Embed]): The embeds which should be posted.
 
     Returns:
-        (discord.Embed): The info embed.
+        Iterator[List[discord.Embed]]: The groups of embeds within the limits imposed by Discord for a single message.
     """
-    description = "Der Lockdown für diesen Kanal wurde aufgehoben und es können wieder ungehindert Nachrichten " \
-                  "versendet werden. \n\n**__Vielen Dank für die Geduld.__** :handshake:"
+    group = []
+    group_length = 0
 
-    embed = discord.Embed(title=":sparkles: Lockdown-Aufhebung :sparkles:", color=const.EMBED_COLOR_INFO,
-                          description=description)
+    for embed in embeds:
+        if group and (len(group) == const.LIMIT_EMBEDS_PER_MESSAGE
+                      or group_length + len(embed) > const.LIMIT_EMBED_CHARACTERS):
+            yield group
+            group = []
+            group_length = 0
 
-    return embed
+        group.append(embed)
+        group_length += len(embed)
+
+    if group:
+        yield group
 
 
-def _build_server_lockdown_lift_embed() -> discord.Embed:
-    """Creates an embed which informs members that the server-wide lockdown has been lifted.
+def _build_modlog_embed(action: str, color: discord.Colour, moderator: Union[discord.Member, discord.ClientUser],
+                        user: Optional[discord.Member], reason: Optional[str],
+                        details: Optional[str] = None) -> discord.Embed:
+    """Creates an embed which gets posted in the configured modlog channel.
+
+     The embed serves as an information for other moderators about what happend on the server and is therefore in
+     general nothing more than a simple log message. It contains the moderator who performed the action, the affected
+     member (if any) and the optional reason provided by said moderator why this has happened, as well as optional
+     details about the incident.
 
     Returns:
         (discord.Embed): The info embed.
     """
-    description = "Der serverweite Lockdown wurde aufgehoben und es können wieder ungehindert Nachrichten " \
-                  "versendet werden. \n\n**__Vielen Dank für die Geduld.__** :handshake:"
-
-    embed = discord.Embed(title=":sparkles: Lockdown-Aufhebung :sparkles:", color=const.EMBED_COLOR_INFO,
-                          description=description)
+    description = f"**Betroffener:** {user}\n" if user else ""
+    description += f"**Moderator:** {moderator}"
+    if reason:
+        description += f"\n**Begründung:** {reason}"
+    if details:
+        description += f"\n**Details:** {details}"
 
-    return embed
+    return discord.Embed(title=action, color=color, description=description)
 
 
 def _build_warnings_embed(user: discord.Member, warnings: List[tuple]) -> discord.Embed:
@@ -1348,33 +1646,39 @@ def _build_warnings_embed(user: discord.Member, warnings: List[tuple]) -> discor
     Returns:
         (discord.Embed): The embed listing the warnings of a user.
     """
-    embed = discord.Embed(title=f"Verwarnungen von {user.display_name} :rotating_light:", timestamp=utils.utcnow(),
-                          description="__Gesamt:__ {0}".format(len(warnings)),
-                          color=const.EMBED_COLOR_MODERATION)
-    embed.set_footer(text="Stand")
-    embed.set_thumbnail(url=user.display_avatar)
-
-    for warning in warnings:
-        timestamp = datetime.strptime(warning[1], '%Y-%m-%d %H:%M:%S.%f%z')
-        str_time = timestamp.strftime('%d.%m.%Y um %H:%M')
-        reason = warning[2] if warning[2] else "Keine Angabe."
-
-        embed.add_field(name=f"#{warning[0]} :small_orange_diamond: {str_time}", value=f"**Grund:** {reason}",
-                        inline=False)
-    return embed
+    fields = []
+
+    for warning_id, timestamp, reason in warnings:
+        str_time = datetime.fromisoformat(timestamp).strftime(_WARNING_DATE_FORMAT)
+
+        fields.append({"name": f"#{warning_id} :small_orange_diamond: {str_time}",
+                       "value": f"**Grund:** {reason if reason else 'Keine Angabe.'}", "inline": False})
+
+    # Creating the embed from a dict allows to set all fields at once instead of validating them one by one.
+    return discord.Embed.from_dict({
+        "title": f"Verwarnungen von {user.display_name} :rotating_light:",
+        "description": f"__Gesamt:__ {len(warnings)}",
+        "color": const.EMBED_COLOR_MODERATION,
+        "timestamp": utils.utcnow().isoformat(),
+        "footer": {"text": "Stand"},
+        "thumbnail": {"url": str(user.display_avatar)},
+        "fields": fields
+    })
 
 
 def _build_mod_action_embed(action: str, description: str, reason: Optional[str],
-                            ch_rules: discord.TextChannel) -> discord.Embed:
+                            note: Optional[str]) -> discord.Embed:
     """Creates an info embed for a specific mod action.
 
     The embed contains information about the action which has been performed, the moderator who did it and an optional
-    reason why this has happened to the user.
+    reason why this has happened to the user. An optional note can be added as well, e.g. to remind the user of the
+    rules of the server.
 
     Args:
         action (str): The mod action which has been performed.
         description (str): A description explaining what happened.
-        reason (Optional[str])
+        reason (Optional[str]): The reason provided by the moderator.
+        note (Optional[str]): An additional note for the affected user.
 
     Returns:
         (discord.Embed): The final info embed dialog
@@ -1384,10 +1688,8 @@ def _build_mod_action_embed(action: str, description: str, reason: Optional[str]
     if reason:
         embed.add_field(name="Begründung des Moderators:", value=reason)
 
-    if action != "Bann":
-        embed.add_field(name="Hinweis :information_source:", inline=False,
-                        value=f"Versuch bitte, dich in Zukunft besser an unsere {ch_rules.mention} zu halten, da "
-                              f"wir ansonsten gezwungen sind, härtere Strafen zu verhängen. :scales:")
+    if note:
+        embed.add_field(name="Hinweis :information_source:", inline=False, value=note)
 
     return embed
 
@@ -1402,12 +1704,8 @@ def _build_purge_confirmation_embed(channel: discord.TextChannel, amount: int) -
     Returns:
         (discord.Embed): The embed with the confirmation dialog
     """
-    description = "**Bist du dir sicher, dass du im Kanal {0} __{1} Nachrichten__ löschen möchtest?**\nDiese " \
-                  "Operation kann nicht rückgängig gemacht werden! Überlege dir daher gut, ob du das auch wirklich " \
-                  "tun möchtest.".format(channel.mention, amount)
-
-    return discord.Embed(title=":warning: Purge-Bestätigung :warning:", description=description,
-                         color=const.EMBED_COLOR_WARNING)
+    return discord.Embed(title=":warning: Purge-Bestätigung :warning:", color=const.EMBED_COLOR_WARNING,
+                         description=_PURGE_CONFIRMATION.format(channel=channel.mention, amount=amount))
 
 
 def _build_lockdown_confirmation_embed(channel: Optional[Union[discord.TextChannel, discord.VoiceChannel]]) \
@@ -1448,8 +1746,8 @@ def _create_report_embed(offender: discord.Member, reporter: discord.Member, cha
     Returns:
         discord.Embed: An embedded message containing information about a possible offender.
     """
-    joined_at = offender.joined_at.strftime("%d.%m.%Y - %H:%M")
-    created_at = offender.created_at.strftime("%d.%m.%Y - %H:%M")
+    joined_at = offender.joined_at.strftime(_REPORT_DATE_FORMAT)
+    created_at = offender.created_at.strftime(_REPORT_DATE_FORMAT)
 
     embed = discord.Embed(title="Nutzer-Infos", color=const.EMBED_COLOR_REPORT, timestamp=utils.utcnow(),
                           description=f"**Name:** {offender}\n**Beitritt am:** {joined_at}\n"
@@ -1462,6 +1760,31 @@ def _create_report_embed(offender: discord.Member, reporter: discord.Member, cha
     return embed
 
 
+def _build_modmail_embed(title: str, color: int, author: Union[discord.Member, discord.User], message: str,
+                         image_url: Optional[str], timestamp: datetime) -> discord.Embed:
+    """Creates an embed containing a modmail submitted by a user.
+
+    Args:
+        title (str): The title of the embed.
+        color (int): The color of the embed.
+        author (Union[discord.Member, discord.User]): The user who submitted the modmail.
+        message (str): The message which has been sent to the moderators.
+        image_url (Optional[str]): The URL of an image attached to the modmail.
+        timestamp (datetime): A timestamp representing the moment when the modmail has been received.
+
+    Returns:
+        discord.Embed: The embed containing the modmail.
+    """
+    embed = discord.Embed(title=title, color=color, timestamp=timestamp, description=message)
+    embed.set_author(name=str(author), icon_url=author.display_avatar)
+    embed.set_footer(text="Erhalten am")
+
+    if image_url:
+        embed.set_image(url=image_url)
+
+    return embed
+
+
 def _modmail_create_ticket_list(messages: List[tuple]) -> str:
     """Method which creates a string representing a list of modmail tickets.
 
@@ -1475,16 +1798,14 @@ def _modmail_create_ticket_list(messages: List[tuple]) -> str:
     Returns:
         str: A listing of hyperlinks with the specified Discord messages as their targets.
     """
-    string = ""
-
-    for message in messages:
-        timestamp = datetime.strptime(message[2], '%Y-%m-%d %H:%M:%S.%f%z')
-        str_time = timestamp.strftime('%d.%m.%Y %H:%M')
+    url_modmail = f"{const.URL_DISCORD}/channels/{const.SERVER_ID}/{const.CHANNEL_ID_MODMAIL}"
+    entries = []
 
-        string += "- {0} | [{1[1]}]({2}/channels/{3}/{4}/{1[0]})\n" \
-            .format(str_time, message, const.URL_DISCORD, const.SERVER_ID, const.CHANNEL_ID_MODMAIL)
+    for message_id, author, timestamp in messages:
+        str_time = datetime.fromisoformat(timestamp).strftime(_TICKET_DATE_FORMAT)
+        entries.append(f"- {str_time} | [{author}]({url_modmail}/{message_id})\n")
 
-    return string
+    return "".join(entries)
 
 
 def _modmail_create_list_embed(status: ModmailStatus, modmail: List[tuple]) -> discord.Embed:
@@ -1497,56 +1818,75 @@ def _modmail_create_list_embed(status: ModmailStatus, modmail: List[tuple]) -> d
     Returns:
         discord.Embed: The embed containing the list of hyperlinks with the authors name as the link text.
     """
-    embed = discord.Embed(timestamp=utils.utcnow())
-    embed.set_footer(text="Erstellt am")
-    dict_embed = embed.to_dict()
+    if status not in _MODMAIL_LIST_EMBED:
+        raise ValueError(f"Nicht unterstützter Modmail-Status '{status.name.title()}'.")
 
     if modmail is not None:
-        dict_embed = embed.to_dict()
-        dict_embed["description"] = _modmail_create_ticket_list(modmail)
-
-        if status == ModmailStatus.OPEN:
-            dict_embed["title"] = "Offenen Tickets: " + str(len(modmail))
-            dict_embed["color"] = const.EMBED_COLOR_MODMAIL_OPEN
-        elif status == ModmailStatus.ASSIGNED:
-            dict_embed["title"] = "Zugewiesene Tickets: " + str(len(modmail))
-            dict_embed["color"] = const.EMBED_COLOR_MODMAIL_ASSIGNED
-        else:
-            raise ValueError("Nicht unterstützter Modmail-Status '{0}'.".format(status.name.title()))
-    elif status == ModmailStatus.OPEN:
-        dict_embed["title"] = "Keine offenen Tickets! :tada:"
-        dict_embed["color"] = const.EMBED_COLOR_MODMAIL_CLOSED
-        dict_embed["description"] = "Lehne dich zurück und entspanne ein wenig. Momentan gibt es für dich keine " \
-                                    "Tickets, welche du abarbeiten könntest. :beers:"
-    elif status == ModmailStatus.ASSIGNED:
-        dict_embed["title"] = "Keine Tickets in Bearbeitung! :eyes:"
-        dict_embed["color"] = const.EMBED_COLOR_MODMAIL_ASSIGNED
-        dict_embed["description"] = "**Es ist ruhig, zu ruhig...** Vielleicht gibt es momentan ja ein paar offene " \
-                                    "Tickets die bearbeitet werden müssten."
+        title, color = _MODMAIL_LIST_EMBED[status]
+        embed = discord.Embed(title=title.format(len(modmail)), color=color,
+                              description=_modmail_create_ticket_list(modmail), timestamp=utils.utcnow())
     else:
-        raise ValueError("Nicht unterstützter Modmail-Status '{0}'.".format(status.name.title()))
+        title, color, description = _MODMAIL_EMPTY_LIST_EMBED[status]
+        embed = discord.Embed(title=title, color=color, description=description, timestamp=utils.utcnow())
+
+    embed.set_footer(text="Erstellt am")
+    return embed
 
-    return discord.Embed.from_dict(dict_embed)
 
+def _paginate_fields(create_embed: Callable[[], discord.Embed], fields: Iterable[Tuple[str, str]]) \
+        -> Iterator[discord.Embed]:
+    """Lazily distributes the given fields over as many embeds as needed to stay within the limits set by Discord.
 
-def _trim_role_string(roles: str, num_total_roles: int):
-    """Cuts the role string for the role field to the embed limit of 1024 and appends the text 'und x weitere' where x is the number of cut off roles.
+    A new embed is created as soon as the current one either holds the maximum amount of fields or adding the next
+    field would exceed the maximum amount of characters.
 
-     Args:
-        roles (str): String of all roles the user has by ids (eg. '<@1234...> <@456...> ...' .
-        num_total_roles (int): Number of roles the user has.
+    Args:
+        create_embed (Callable[[], discord.Embed]): A function creating an empty embed for a single page.
+        fields (Iterable[Tuple[str, str]]): The names and values of the fields which should be added.
 
     Returns:
-        str: The passed role string, trimmed down to less than 1024 characters.
+        Iterator[discord.Embed]: The embeds containing the given fields.
     """
-    roles_shortened = roles[:1009]
-    num_printed_roles = roles_shortened.count(">")  # Count number of non-cut roles that are still in the string (they end with '>')
-    remaining_roles = num_total_roles - num_printed_roles
-
-    cut_index = roles_shortened.rfind(" ")
-    roles_shortened = roles_shortened[:cut_index]
-    roles = f"{roles_shortened} und {remaining_roles} weitere."
-    return roles
+    embed = create_embed()
+
+    for name, value in fields:
+        if len(embed.fields) == const.LIMIT_EMBED_FIELDS \
+                or len(embed) + len(name) + len(value) > const.LIMIT_EMBED_CHARACTERS:
+            yield embed
+            embed = create_embed()
+
+        embed.add_field(name=name, value=value)
+
+    yield embed
+
+
+def _build_role_string(roles: List[discord.Role]) -> str:
+    """Joins the mentions of the given roles for the role field of an embed.
+
+    If the mentions exceed the embed limit of 1024 characters, only as many roles as fit are listed and the text
+    'und x weitere.' is appended, where x is the number of cut off roles. Mentions are only built until the limit has
+    been exceeded, so that no text is created which would be cut off anyway.
+
+    Args:
+        roles (List[discord.Role]): The roles which should be listed.
+
+    Returns:
+        str: The mentions of the roles, trimmed down to less than 1024 characters.
+    """
+    mentions = []
+    length = -1  # No separator is needed in front of the first mention.
+    num_printed_roles = 0
+
+    for role in roles:
+        mentions.append(role.mention)
+        length += len(mentions[-1]) + 1
+
+        if length <= 1009:  # Leaves enough room for the text appended to a trimmed role string.
+            num_printed_roles += 1
+        elif length > 1024:
+            return f"{' '.join(mentions[:num_printed_roles])} und {len(roles) - num_printed_roles} weitere."
+
+    return " ".join(mentions)
 
 
 async def setup(bot):
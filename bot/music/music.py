@@ -1,6 +1,9 @@
 """Contains a Cog for all music funcionality."""
 
 import asyncio
+from collections import deque
+from contextlib import suppress
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 import discord
@@ -10,6 +13,8 @@ from bot import constants as const
 from bot.music.ytdl_source import YTDLSource
 from bot.logger import command_log, log
 
+_SUPPORTED_DOMAINS = frozenset(("youtube.com", "youtu.be"))
+
 
 class MusicCog(commands.Cog):
     """Cog for music functions."""
@@ -21,8 +26,9 @@ class MusicCog(commands.Cog):
             bot (discord.ext.commands.Bot): The bot for which this cog should be enabled.
         """
         self.bot = bot
-        self.song_queue = list()
+        self.song_queue = deque(maxlen=const.LIMIT_SONG_QUEUE)  # The oldest songs are dropped once it's full.
         self.loop_mode = False
+        self._player = None  # The task playing the songs of the queue.
 
     # A special method that registers as a commands.check() for every command and subcommand in this cog.
     async def cog_check(self, ctx):
@@ -60,24 +66,11 @@ class MusicCog(commands.Cog):
             await ctx.send("Der von dir angegebene Link ist leider ungültig.", delete_after=const.TIMEOUT_INFORMATION)
             return
 
-        if len(self.song_queue) == const.LIMIT_SONG_QUEUE:
-            self.song_queue = self.song_queue[len(media_list):]
-
-        for song_url in media_list:
-            self.song_queue.append(song_url)  # Use list.append() because it's thread safe.
-
-        if not ctx.voice_client.is_playing():
-            while True:
-                for song_url in self.song_queue:
-                    try:
-                        source = await YTDLSource.get_media(song_url, loop=self.bot.loop)
-                        ctx.voice_client.play(source)
-                    except ValueError as error:
-                        log.error(error)
-                        self.song_queue.remove(song_url)
+        self.song_queue.extend(media_list)  # Use deque.extend() because it's thread safe.
 
-                if not self.loop_mode:
-                    break
+        # The voice client isn't playing while the media of a song is being extracted, so check the task instead.
+        if self._player is None or self._player.done():
+            self._player = asyncio.create_task(self._play_song_queue(ctx.voice_client))
         else:
             info_message = ("Die Songs wurden" if len(media_list) > 1 else "Der Song wurde") + \
                            " erfolgreich der Wiedergabeliste hinzugefügt."
@@ -104,6 +97,12 @@ class MusicCog(commands.Cog):
         """
 
         if ctx.voice_client and ctx.voice_client.channel == ctx.author.voice.channel:
+            if self._player:
+                self._player.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._player
+                self._player = None
+
             await ctx.voice_client.disconnect()
             self.song_queue.clear()
             self.loop_mode = False
@@ -150,6 +149,76 @@ class MusicCog(commands.Cog):
             await ctx.send("Derzeit werden leider nur YouTube-Links unterstützt.",
                            delete_after=const.TIMEOUT_INFORMATION)
 
+    async def _play_song_queue(self, voice_client: discord.VoiceClient):
+        """Plays the songs of the queue one after another until it's empty or the bot has been disconnected.
+
+        Songs are removed from the queue as soon as they start playing, and appended to it again once they have been
+        played if the loop mode is active. While a song is playing, the media info of the next one is already being
+        extracted so that there's no gap between two songs. The source of a song, which starts an FFmpeg process, is only
+        created right before it's played. Songs whose media can't be extracted are skipped.
+
+        Args:
+            voice_client (discord.VoiceClient): The voice client which should play the songs.
+        """
+        next_song = self._prepare_song()
+        finished = asyncio.Event()
+
+        def on_song_finished(error: Optional[Exception]):
+            # Called by the audio thread of the voice client, which is why the event has to be set via the event loop.
+            if error:
+                log.error("The playback of a song has been interrupted: %s", error)
+            self.bot.loop.call_soon_threadsafe(finished.set)
+
+        try:
+            while next_song and voice_client.is_connected():
+                song_url, media_info = next_song
+                self.song_queue.popleft()
+                next_song = self._prepare_song()
+
+                try:
+                    source = await YTDLSource.from_media_info(await media_info, loop=self.bot.loop)
+                except Exception as error:  # pylint: disable=broad-except
+                    log.error("The media of the song \"%s\" couldn't be extracted: %s", song_url, error)
+                    source = None
+
+                # The bot might have been disconnected while the media was being extracted.
+                if not voice_client.is_connected():
+                    if source:
+                        source.cleanup()
+                    break
+
+                if source:
+                    finished.clear()
+                    voice_client.play(source, after=on_song_finished)
+                    await finished.wait()
+
+                    if self.loop_mode:
+                        self.song_queue.append(song_url)
+
+                # The next song might have been dropped from the full queue in the meantime or the queue might have
+                # been cleared, in which case whatever is at the head of the queue now is being prepared instead.
+                if next_song and (not self.song_queue or self.song_queue[0] != next_song[0]):
+                    next_song[1].cancel()
+                    next_song = None
+                if next_song is None:
+                    next_song = self._prepare_song()
+        finally:
+            if next_song:
+                next_song[1].cancel()
+
+    def _prepare_song(self) -> Optional[Tuple[str, asyncio.Task]]:
+        """Starts extracting the media info of the song at the head of the queue in the background.
+
+        Returns:
+            Optional[Tuple[str, asyncio.Task]]: The URL of the song and the task extracting its media info, or None if
+            the queue is empty.
+        """
+        if not self.song_queue:
+            return None
+
+        song_url = self.song_queue[0]
+        return song_url, asyncio.create_task(YTDLSource.get_media_info(song_url, loop=self.bot.loop))
+
 
 def _check_if_supported_url(url: str):
     """Method which raises an exception if the provided URL is not supported.
@@ -158,11 +227,7 @@ def _check_if_supported_url(url: str):
         url (str): The provided URL.
     """
 
-    platforms = ["youtube.com"]
-    url_parsed = urlparse(url)
-    domain = url_parsed.netloc[4:] if url_parsed.netloc.startswith("www.") else url_parsed.netloc
-
-    if domain not in platforms:
+    if urlparse(url).netloc.removeprefix("www.") not in _SUPPORTED_DOMAINS:
         raise commands.BadArgument("Platform not supported.")
 
 
@@ -1,10 +1,15 @@
 """Class which represents a YoutTube streaming source for the music player."""
 
 import asyncio
-from typing import List
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import discord
-import youtube_dl
+import yt_dlp
+
+from bot import constants as const
 
 
 ffmpeg_options = {
@@ -27,8 +32,16 @@ ytdl_format_options = {
     'default_search': 'auto',
     'source_address': '0.0.0.0'  # Bind to ipv4 since ipv6 addresses cause issues sometimes
 }
-youtube_dl.utils.bug_reports_message = lambda: ''  # Suppress noise about console usage from errors
-ytdl = youtube_dl.YoutubeDL(ytdl_format_options)
+yt_dlp.utils.bug_reports_message = lambda: ''  # Suppress noise about console usage from errors
+ytdl = yt_dlp.YoutubeDL(ytdl_format_options)
+
+# Extractions are slow and blocking, which is why they're run in their own threads together with the start of FFmpeg.
+# This way they can't use up the default executor of the event loop, which is also used for database calls.
+_extractor_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ytdl")
+
+# Extracted info of the most recently streamed songs along with the time of their extraction. Songs are often played
+# repeatedly (e.g. in loop mode), but the stream URLs contained in the info expire after a while.
+_media_info_cache = OrderedDict()
 
 
 class YTDLSource(discord.PCMVolumeTransformer):
@@ -53,31 +66,112 @@ class YTDLSource(discord.PCMVolumeTransformer):
 
         clean_url = url.split("&", 1)[0]
         loop = loop or asyncio.get_event_loop()
-        data = await loop.run_in_executor(None, lambda: ytdl.extract_info(clean_url, download=not stream))
+        data = await loop.run_in_executor(_extractor_pool, lambda: ytdl.extract_info(clean_url, download=not stream))
 
         if not data:
             raise ValueError("Invalid video URL.")
 
         if "entries" in data:
-            return ["https://www.youtube.com/watch?v={0}".format(entry["url"]) for entry in data["entries"]]
+            # Unavailable videos of a playlist are returned as None, since extraction errors are ignored.
+            return ["https://www.youtube.com/watch?v={0}".format(entry["id"]) for entry in data["entries"] if entry]
 
         return [clean_url]
 
     @classmethod
-    async def get_media(cls, url, *, loop=None, stream=True):
+    async def get_media_info(cls, url, *, loop=None, stream=True) -> dict:
         """Method for extracting info of video provided by the URL.
 
         Args:
             url (str): The URL to the specified song.
             loop (bool): The event loop provided by the bot.
             stream (bool): Indicates if the information should be streamed instead of downloaded.
+
+        Returns:
+            dict: The info extracted by yt-dlp.
         """
 
-        loop = loop or asyncio.get_event_loop()
-        data = await loop.run_in_executor(None, lambda: ytdl.extract_info(url, download=not stream))
+        data = _get_cached_media_info(url) if stream else None
 
         if not data:
-            raise ValueError("Invalid video URL.")
+            loop = loop or asyncio.get_event_loop()
+            data = await loop.run_in_executor(_extractor_pool, lambda: ytdl.extract_info(url, download=not stream))
+
+            if not data:
+                raise ValueError("Invalid video URL.")
+            if stream:
+                _cache_media_info(url, data)
+
+        return data
+
+    @classmethod
+    async def from_media_info(cls, data, *, loop=None, stream=True):
+        """Method for creating a playable source from the extracted info of a video.
+
+        The FFmpeg process streaming the audio is started right away, which is why the source should only be created
+        once it's about to be played.
+
+        Args:
+            data (dict): The info extracted by yt-dlp.
+            loop (bool): The event loop provided by the bot.
+            stream (bool): Indicates if the information should be streamed instead of downloaded.
+        """
 
+        loop = loop or asyncio.get_event_loop()
         filename = data['url'] if stream else ytdl.prepare_filename(data)
-        return cls(discord.FFmpegPCMAudio(filename, **ffmpeg_options), data=data)
+        # Starting the FFmpeg process blocks as well.
+        creation = loop.run_in_executor(_extractor_pool, lambda: discord.FFmpegPCMAudio(filename, **ffmpeg_options))
+
+        try:
+            source = await asyncio.shield(creation)
+        except asyncio.CancelledError:
+            # The process is started nonetheless, which is why it has to be stopped again once it's running.
+            creation.add_done_callback(_cleanup_source)
+            raise
+
+        return cls(source, data=data)
+
+
+def _cleanup_source(creation: asyncio.Future):
+    """Stops the FFmpeg process of a source whose creation has been cancelled.
+
+    Args:
+        creation (asyncio.Future): The future creating the source.
+    """
+    if not creation.cancelled() and creation.exception() is None:
+        creation.result().cleanup()
+
+
+def _get_cached_media_info(url: str) -> Optional[dict]:
+    """Returns the cached info of the specified song if it has been extracted recently enough.
+
+    Args:
+        url (str): The URL to the song.
+
+    Returns:
+        Optional[dict]: The info extracted by yt-dlp or None, if there is no valid cache entry for the song.
+    """
+    entry = _media_info_cache.get(url)
+    if entry is None:
+        return None
+
+    extracted_at, data = entry
+    if time.monotonic() - extracted_at > const.LIMIT_MEDIA_INFO_AGE * 60:
+        del _media_info_cache[url]
+        return None
+
+    _media_info_cache.move_to_end(url)
+    return data
+
+
+def _cache_media_info(url: str, data: dict):
+    """Caches the extracted info of the specified song and evicts the least recently used entry if the cache is full.
+
+    Args:
+        url (str): The URL to the song.
+        data (dict): The info extracted by yt-dlp.
+    """
+    _media_info_cache[url] = (time.monotonic(), data)
+    _media_info_cache.move_to_end(url)
+
+    if len(_media_info_cache) > const.LIMIT_MEDIA_INFO_CACHE:
+        _media_info_cache.popitem(last=False)
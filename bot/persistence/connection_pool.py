@@ -0,0 +1,111 @@
+"""Contains pools of database connections which are reused instead of opening a new connection for every query."""
+
+import queue
+import sqlite3
+from typing import Dict
+
+MAX_IDLE_CONNECTIONS = 10
+
+# Global connection pools, one for each database file.
+_connection_pools: Dict[str, "ConnectionPool"] = {}
+
+
+class ConnectionPool:
+    """Thread-safe pool of connections to a single SQLite database file.
+
+    Connections which have been released are kept open and handed out again the next time a connection is needed. If
+    every pooled connection is currently in use, a new one will be opened instead of waiting for one to be released.
+    Only up to `max_idle` connections are kept open once they have been released, the rest of them will be closed.
+    """
+
+    def __init__(self, db_file: str, max_idle: int = MAX_IDLE_CONNECTIONS):
+        """Initializes the pool for the specified database file.
+
+        Args:
+            db_file (str): The name (or path) of the db file.
+            max_idle (int): The maximum amount of connections which are kept open while not being used.
+        """
+        self._db_file = db_file
+        self._idle_connections = queue.LifoQueue(maxsize=max_idle)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Returns an idle connection of the pool or opens a new one if there isn't any.
+
+        Since database calls might be executed in worker threads, the connections can be used by any thread.
+
+        Returns:
+            Connection: The database connection object.
+        """
+        try:
+            return self._idle_connections.get_nowait()
+        except queue.Empty:
+            return _connect(self._db_file)
+
+    def release(self, connection: sqlite3.Connection):
+        """Returns a connection to the pool so that it can be reused.
+
+        Uncommitted changes are rolled back beforehand, so that the next user of the connection starts with a clean
+        state.
+
+        Args:
+            connection (Connection): The database connection which is no longer needed.
+        """
+        if connection.in_transaction:
+            connection.rollback()
+
+        try:
+            self._idle_connections.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self):
+        """Closes every idle connection of the pool."""
+        while True:
+            try:
+                self._idle_connections.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _connect(db_file: str) -> sqlite3.Connection:
+    """Opens a new connection to the specified database file.
+
+    The database uses write-ahead logging, so that reads don't have to wait for a write of another connection to finish.
+    In this mode, syncing the file at every commit isn't necessary to prevent the database from getting corrupted.
+
+    Args:
+        db_file (str): The name (or path) of the db file.
+
+    Returns:
+        Connection: The database connection object.
+    """
+    connection = sqlite3.connect(db_file, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def get_connection_pool(db_file: str) -> ConnectionPool:
+    """Returns the connection pool for the specified database file and creates it if it doesn't exist yet.
+
+    Args:
+        db_file (str): The name (or path) of the db file.
+
+    Returns:
+        ConnectionPool: The connection pool of the db file.
+    """
+    pool = _connection_pools.get(db_file)
+    if pool is None:
+        pool = _connection_pools.setdefault(db_file, ConnectionPool(db_file))
+    return pool
+
+
+def close_connection_pool(db_file: str):
+    """Closes every idle connection to the specified database file and discards its pool.
+
+    Args:
+        db_file (str): The name (or path) of the db file.
+    """
+    pool = _connection_pools.pop(db_file, None)
+    if pool is not None:
+        pool.close()
@@ -1,9 +1,12 @@
 """Contains logic for connecting to and manipulating the database."""
 
 import datetime
+import threading
+from pathlib import Path
 from sqlite3 import Error
-from typing import List, Optional, Iterator, Iterable
+from typing import Dict, List, Optional, Iterator, Iterable
 
+from bot.logger import log
 from bot.moderation import ModmailStatus
 from bot.persistence import queries
 from .database_manager import DatabaseManager
@@ -28,14 +31,23 @@ class DatabaseConnector:
             raise Error("Database filepath and/or filename hasn't been set.")
 
         self._db_file = db_file
-        with DatabaseManager(self._db_file) as db_manager:
-            if init_script:
-                queries_ = self.parse_sql_file(init_script)
-                for query in queries_:
-                    try:
-                        db_manager.execute(query)
-                    except Error as error:
-                        print(f"Command could not be executed, skipping it: {error}")
+
+        # Caches for the warnings of members, which are read repeatedly but change rarely. They are invalidated every
+        # time a warning gets added or removed. Since the methods are called from worker threads, the caches are guarded
+        # by a lock. Every invalidation increments a counter, so that rows which have been read before the change of the
+        # warnings aren't stored in the caches afterwards.
+        self._warnings_cache = {}
+        self._warning_userid_cache = {}
+        self._warnings_lock = threading.Lock()
+        self._warnings_generation = 0
+
+        if init_script:
+            with DatabaseManager(self._db_file) as db_manager:
+                # The whole script is handed over to SQLite at once, which also takes care of splitting the statements.
+                try:
+                    db_manager.executescript(Path(init_script).read_text(encoding="utf-8"))
+                except Error as error:
+                    log.error("The init script could not be executed: %s", error)
 
     def add_member_warning(self, user_id: int, timestamp: datetime.datetime, reason: Optional[str]):
         """Adds a warning to the table "MemberWarning".
@@ -49,6 +61,10 @@ class DatabaseConnector:
             db_manager.execute(queries.INSERT_MEMBER_WARNING, (user_id, timestamp, reason))
             db_manager.commit()
 
+        with self._warnings_lock:
+            self._warnings_generation += 1
+            self._warnings_cache.pop(user_id, None)
+
     def remove_member_warning(self, warning_id: int):
         """Removes the warning with the specified id from the table "MemberWarning".
 
@@ -59,6 +75,14 @@ class DatabaseConnector:
             db_manager.execute(queries.DELETE_MEMBER_WARNING, (warning_id,))
             db_manager.commit()
 
+        with self._warnings_lock:
+            self._warnings_generation += 1
+            user_id = self._warning_userid_cache.pop(warning_id, None)
+            if user_id is None:
+                self._warnings_cache.clear()
+            else:
+                self._warnings_cache.pop(user_id, None)
+
     def remove_member_warnings(self, user_id: int):
         """Removes all warnings of a member from the table "MemberWarning".
 
@@ -69,6 +93,13 @@ class DatabaseConnector:
             db_manager.execute(queries.DELETE_MEMBER_WARNINGS, (user_id,))
             db_manager.commit()
 
+        with self._warnings_lock:
+            self._warnings_generation += 1
+            self._warnings_cache.pop(user_id, None)
+            for warning_id in [warning_id for warning_id, warned_user_id in self._warning_userid_cache.items()
+                               if warned_user_id == user_id]:
+                del self._warning_userid_cache[warning_id]
+
     def get_warning_userid(self, warning_id: int) -> Optional[int]:
         """Gets the id of the member which received the warning with the specified id.
 
@@ -78,14 +109,22 @@ class DatabaseConnector:
         Returns:
             Optional[int]: The id of the member who has been warned.
         """
+        with self._warnings_lock:
+            if warning_id in self._warning_userid_cache:
+                return self._warning_userid_cache[warning_id]
+            generation = self._warnings_generation
+
         with DatabaseManager(self._db_file) as db_manager:
-            result = db_manager.execute(queries.GET_WARNING_USERID, (warning_id,))
+            row = db_manager.execute(queries.GET_WARNING_USERID, (warning_id,)).fetchone()
 
-            row = result.fetchone()
-            if row:
-                return int(row[0])
+        if not row:
             return None
 
+        with self._warnings_lock:
+            if generation == self._warnings_generation:
+                self._warning_userid_cache[warning_id] = int(row[0])
+        return int(row[0])
+
     def get_member_warnings(self, user_id: int) -> Optional[List[tuple]]:
         """Gets all the warnings of a specific member.
 
@@ -96,13 +135,18 @@ class DatabaseConnector:
             Optional[List[tuple]]: A list containing the id of the warning, the timestamp when it happened and the
                                    reason provided by the moderator.
         """
+        with self._warnings_lock:
+            if user_id in self._warnings_cache:
+                return self._warnings_cache[user_id]
+            generation = self._warnings_generation
+
         with DatabaseManager(self._db_file) as db_manager:
-            result = db_manager.execute(queries.GET_MEMBER_WARNINGS, (user_id,))
+            rows = db_manager.execute(queries.GET_MEMBER_WARNINGS, (user_id,)).fetchall() or None
 
-            rows = result.fetchall()
-            if rows:
-                return rows
-            return None
+        with self._warnings_lock:
+            if generation == self._warnings_generation:
+                self._warnings_cache[user_id] = rows
+        return rows
 
     def add_member_name(self, user_id: int, name: str, timestamp: datetime.datetime):
         """Adds a members old nickname to the table "MemberNameHistory".
@@ -116,18 +160,21 @@ class DatabaseConnector:
             db_manager.execute(queries.INSERT_MEMBER_NAME, (user_id, name, timestamp))
             db_manager.commit()
 
-    def get_member_names(self, user_id: int) -> Optional[List[tuple]]:
-        """Gets all the nicknames used by a member from the table "MemberNameHistory".
+    def get_member_names(self, user_id: int, limit: int) -> Optional[List[tuple]]:
+        """Gets the most recent nicknames used by a member from the table "MemberNameHistory".
+
+        The timestamps are already formatted by SQLite, so they don't have to be parsed again.
 
         Args:
             user_id (int): The id of the member whose nicknames have been requested.
+            limit (int): The maximum amount of nicknames which should be returned.
 
         Returns:
-            Optional[List[tuple]]: A list containing tuples consisting of the nickname and the timestamp representing
-                                   when the name has been replaced.
+            Optional[List[tuple]]: A list containing tuples consisting of the nickname as well as the date (dd.mm.yyyy)
+                                   and time (HH:MM:SS) representing when the name has been replaced.
         """
         with DatabaseManager(self._db_file) as db_manager:
-            result = db_manager.execute(queries.GET_MEMBER_NAMES, (user_id,))
+            result = db_manager.execute(queries.GET_MEMBER_NAMES, (user_id, limit))
 
             rows = result.fetchall()
             if rows:
@@ -347,6 +394,17 @@ class DatabaseConnector:
             db_manager.execute(queries.CHANGE_MODMAIL_STATUS, (status.value, msg_id))
             db_manager.commit()
 
+    def change_modmail_statuses(self, statuses: Dict[int, ModmailStatus]):
+        """Changes the status of multiple modmail at once.
+
+        Args:
+            statuses (Dict[int, ModmailStatus]): The new status of each modmail keyed by its message id.
+        """
+        with DatabaseManager(self._db_file) as db_manager:
+            db_manager.executemany(queries.CHANGE_MODMAIL_STATUS,
+                                   [(status.value, msg_id) for msg_id, status in statuses.items()])
+            db_manager.commit()
+
     def get_all_modmail_with_status(self, status: ModmailStatus) -> Optional[List[tuple]]:
         """Returns the message id of every modmail with the specified status.
 
@@ -376,8 +434,8 @@ class DatabaseConnector:
         """
         with DatabaseManager(self._db_file) as db_manager:
             db_manager.execute(queries.INSERT_GROUP_OFFER, (user_id, course, offered_group))
-            for group_nr in requested_groups:
-                db_manager.execute(queries.INSERT_GROUP_REQUEST, (user_id, course, group_nr))
+            db_manager.executemany(queries.INSERT_GROUP_REQUEST,
+                                   ((user_id, course, group_nr) for group_nr in requested_groups))
             db_manager.commit()
 
     def update_group_exchange_message_id(self, user_id: int, course: str, message_id: int):
@@ -500,17 +558,3 @@ class DatabaseConnector:
         with DatabaseManager(self._db_file) as db_manager:
             db_manager.execute(queries.DEACTIVATE_BOTONLY_FOR_CHANNEL, (channel_id,))
             db_manager.commit()
-
-    @staticmethod
-    def parse_sql_file(filename: str) -> List[str]:
-        """Parses a SQL script to read all queries/commands it contains.
-
-        Args:
-            filename (str): The filename of the init file. Can also be a path.
-
-        Returns:
-            List[str]: A list of strings with each entry being a SQL query.
-        """
-        with open(filename, 'r') as file:
-            sql_content = file.read()
-            return sql_content.split(';')
@@ -1,8 +1,8 @@
 """Context manager for managing database connections."""
 
-import sqlite3
 from sqlite3 import Error
 
+from bot.persistence.connection_pool import get_connection_pool
 from bot.persistence.in_memory_db import get_in_memory_connection
 from bot.logger import log
 
@@ -34,7 +34,8 @@ class DatabaseManager:
         """Entry method of the context manager.
 
         Opens the db connection using the `sqlite3` library. If the database is an in-memory database and the connection has not yet been used, it will
-        establish one, otherwise reuse an existing one.
+        establish one, otherwise reuse an existing one. Connections to database files are taken from the connection pool
+        of the respective file.
 
         Returns:
             Connection: The database connection object.
@@ -43,7 +44,7 @@ class DatabaseManager:
             self.connection = get_in_memory_connection()
         else:
             try:
-                self.connection = sqlite3.connect(self._db_file)
+                self.connection = get_connection_pool(self._db_file).acquire()
             except Error as error:
                 log.error(error)
         return self.connection
@@ -51,7 +52,8 @@ class DatabaseManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit method of the context manager.
 
-        Closes the database connection after the code has been executed, if the database is not an in-memory-database.
+        Returns the database connection to its pool after the code has been executed, if the database is not an
+        in-memory-database.
 
         Args:
             exc_type:
@@ -59,4 +61,4 @@ class DatabaseManager:
             exc_tb:
         """
         if self.connection and not self.is_in_memory:
-            self.connection.close()
+            get_connection_pool(self._db_file).release(self.connection)
@@ -12,6 +12,7 @@ def get_in_memory_connection():
     if _in_memory_connection is not None:
         return _in_memory_connection
     else:
-        _in_memory_connection = sqlite3.connect(':memory:')
+        # The connection may be used from worker threads when database calls are offloaded from the event loop.
+        _in_memory_connection = sqlite3.connect(':memory:', check_same_thread=False)
     return _in_memory_connection
 
@@ -73,4 +73,5 @@ DEACTIVATE_BOTONLY_FOR_CHANNEL = "DELETE FROM BotOnlyChannel WHERE ChannelID = ?
 
 # Moderation
 INSERT_MEMBER_NAME = "INSERT INTO MemberNameHistory (UserID, Name, Timestamp) VALUES (?, ?, ?)"
-GET_MEMBER_NAMES = "SELECT Name, Timestamp FROM MemberNameHistory WHERE UserID = ? ORDER BY ROWID DESC"
+GET_MEMBER_NAMES = "SELECT Name, strftime('%d.%m.%Y', Timestamp), strftime('%H:%M:%S', Timestamp) " \
+                   "FROM MemberNameHistory WHERE UserID = ? ORDER BY ROWID DESC LIMIT ?"
@@ -1,4 +1,5 @@
 """Contains a Cog for all functionality regarding server roles."""
+import asyncio
 from sqlite3 import IntegrityError
 from typing import List
 
@@ -87,7 +88,7 @@ class RoleManagementCog(commands.Cog):
             course_id (str): The course ID assigned by the university.
         """
         try:
-            self._db_connector.add_course_role(course_role.id, course_id)
+            await asyncio.to_thread(self._db_connector.add_course_role, course_role.id, course_id)
             log.info("Role \"%s\" has been whitelisted as a course role.", course_role)
             await ctx.send(f':white_check_mark: The role {course_role.mention} has been whitelisted as a course role.')
 
@@ -106,7 +107,7 @@ class RoleManagementCog(commands.Cog):
             ctx (discord.ext.commands.Context): The context in which the command was called.
             course_role (discord.Role): The role which should be removed.
         """
-        self._db_connector.remove_course_role(course_role.id)
+        await asyncio.to_thread(self._db_connector.remove_course_role, course_role.id)
         log.info("Role \"%s\" has been removed as a course role.", course_role)
         await ctx.send(f":white_check_mark: Die Rolle {course_role.mention} wurde aus den verfügbaren Kurs-Rollen "
                        f"entfernt.")
@@ -167,7 +168,7 @@ class RoleManagementCog(commands.Cog):
             await ctx.send(":x: Für den angegebenen Emoji existiert bereits eine Reaction-Role.")
             return
 
-        self._db_connector.add_reaction_role(message.id, emoji, role.id)
+        await asyncio.to_thread(self._db_connector.add_reaction_role, message.id, emoji, role.id)
         await message.add_reaction(emoji)
         log.info("A reaction role has been added to the message with id %s.", message.id)
 
@@ -194,12 +195,12 @@ class RoleManagementCog(commands.Cog):
             await ctx.send(":x: Für den angegebenen Emoji existiert leider keine Reaction-Role.")
             return
 
-        self._db_connector.remove_reaction_role(message.id, emoji)
+        await asyncio.to_thread(self._db_connector.remove_reaction_role, message.id, emoji)
         await message.clear_reaction(emoji)
         log.info("A reaction role has been removed from the message with id %s.", message.id)
 
         if len(message.reactions) == 1:
-            self._db_connector.remove_reaction_role_uniqueness_group(message.id)
+            await asyncio.to_thread(self._db_connector.remove_reaction_role_uniqueness_group, message.id)
 
         await ctx.send(":white_check_mark: Die Reaction-Role wurde erfolgreich entfernt.")
 
@@ -220,8 +221,8 @@ class RoleManagementCog(commands.Cog):
             await ctx.send(f":information_source: Nachrichten außerhalb des Kanals {self.ch_role.mention} können keine "
                            f"Reaction-Roles besitzen.")
             return
-        had_reaction_roles = self._db_connector.clear_reaction_roles(message.id)
-        self._db_connector.remove_reaction_role_uniqueness_group(message.id)
+        had_reaction_roles = await asyncio.to_thread(self._db_connector.clear_reaction_roles, message.id)
+        await asyncio.to_thread(self._db_connector.remove_reaction_role_uniqueness_group, message.id)
 
         if not had_reaction_roles:
             await ctx.send("Die von dir angegebene Nachricht hat keine Reaction-Roles. :face_with_monocle:")
@@ -249,14 +250,14 @@ class RoleManagementCog(commands.Cog):
             await ctx.send(":x: Die angegebene Nachricht besitzt keine Reaction-Roles.")
             return
 
-        if self._db_connector.is_reaction_role_uniqueness_group(message.id):
-            self._db_connector.remove_reaction_role_uniqueness_group(message.id)
+        if await asyncio.to_thread(self._db_connector.is_reaction_role_uniqueness_group, message.id):
+            await asyncio.to_thread(self._db_connector.remove_reaction_role_uniqueness_group, message.id)
             log.info("A reaction role has been added to the message with id %s.", message.id)
 
             await ctx.send(":white_check_mark: Die Reaction-Roles der angegebenen Nachricht sind nicht mehr "
                            "\"exklusiv\".")
         else:
-            self._db_connector.add_reaction_role_uniqueness_group(message.id)
+            await asyncio.to_thread(self._db_connector.add_reaction_role_uniqueness_group, message.id)
             await ctx.send(":white_check_mark: Die Reaction-Roles der angegebenen Nachricht sind nun \"exklusiv\".")
 
     @add_reaction_role.error
@@ -287,7 +288,7 @@ class RoleManagementCog(commands.Cog):
             payload (discord.RawReactionActionEvent): The payload for the triggered event.
         """
         if payload.channel_id == self.ch_role.id and not payload.member.bot:
-            if self._db_connector.is_reaction_role_uniqueness_group(payload.message_id):
+            if await asyncio.to_thread(self._db_connector.is_reaction_role_uniqueness_group, payload.message_id):
                 message = await self.ch_role.fetch_message(payload.message_id)
 
                 for reaction in message.reactions:
@@ -298,7 +299,8 @@ class RoleManagementCog(commands.Cog):
                             await reaction.remove(payload.member)
                             break
 
-                        role_id = self._db_connector.get_reaction_role(payload.message_id, reaction.emoji)
+                        role_id = await asyncio.to_thread(self._db_connector.get_reaction_role, payload.message_id,
+                                                          reaction.emoji)
                         role = self.bot.get_guild(payload.guild_id).get_role(role_id)
 
                         if role in payload.member.roles:
@@ -306,7 +308,8 @@ class RoleManagementCog(commands.Cog):
                                                                            "Reaction.")
                             break
 
-            role_id = self._db_connector.get_reaction_role(payload.message_id, payload.emoji.name)
+            role_id = await asyncio.to_thread(self._db_connector.get_reaction_role, payload.message_id,
+                                              payload.emoji.name)
             role = self.bot.get_guild(payload.guild_id).get_role(role_id)
             await payload.member.add_roles(role, reason="Selbstzuweisung via Reaction.")
 
@@ -321,7 +324,8 @@ class RoleManagementCog(commands.Cog):
             payload (discord.RawReactionActionEvent): The payload for the triggered event.
         """
         if payload.channel_id == self.ch_role.id:
-            role_id = self._db_connector.get_reaction_role(payload.message_id, payload.emoji.name)
+            role_id = await asyncio.to_thread(self._db_connector.get_reaction_role, payload.message_id,
+                                              payload.emoji.name)
             role = self.bot.get_guild(payload.guild_id).get_role(role_id)
 
             member = self.bot.get_guild(payload.guild_id).get_member(payload.user_id)
@@ -338,7 +342,7 @@ class RoleManagementCog(commands.Cog):
             payload (discord.RawReactionActionEvent): The payload for the triggered event.
         """
         if payload.channel_id == self.ch_role.id:
-            self._db_connector.remove_reaction_role_uniqueness_group(payload.message_id)
+            await asyncio.to_thread(self._db_connector.remove_reaction_role_uniqueness_group, payload.message_id)
 
 
 def _create_embed_module_roles(modules_added: List[str], modules_removed: List[str], modules_error: List[str]) \
@@ -4,6 +4,8 @@ from asyncio import get_event_loop
 from aiohttp import ClientSession
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from discord.ext.commands import Bot
 
@@ -13,8 +15,13 @@ from bot.webserver import WebServer
 
 WEBSERVER = None
 HTTP_SESSION = None
-SCHEDULER = AsyncIOScheduler(job_defaults={'misfire_grace_time': 24 * 60 * 60},
-                             jobstores={'default': SQLAlchemyJobStore(url=f'sqlite:///{DB_FILE_PATH}')})
+
+# A single connection is shared by the job store so that adding or removing jobs doesn't open a new connection to the
+# SQLite file every time.
+SCHEDULER_ENGINE = create_engine(f'sqlite:///{DB_FILE_PATH}', poolclass=StaticPool,
+                                 connect_args={'check_same_thread': False})
+SCHEDULER = AsyncIOScheduler(job_defaults={'misfire_grace_time': 24 * 60 * 60, 'coalesce': True, 'max_instances': 1},
+                             jobstores={'default': SQLAlchemyJobStore(engine=SCHEDULER_ENGINE)})
 
 
 async def create_http_session():
@@ -5,6 +5,7 @@ import datetime
 from bot import constants
 from bot.moderation import ModmailStatus
 from bot.persistence import DatabaseConnector
+from bot.persistence.connection_pool import ConnectionPool, close_connection_pool
 
 
 def test_db():
@@ -17,6 +18,110 @@ def test_db():
     conn.add_modmail(47348382920304934, "PKlempe#001", datetime.datetime.now())
     res = conn.get_modmail_status(47348382920304934)
 
+    close_connection_pool("./test.sqlite")
     os.remove("./test.sqlite")
 
     assert res == ModmailStatus.OPEN
+
+
+def test_member_warnings_cache():
+    """Tests if the cached warnings of a member are invalidated when warnings are added or removed.
+
+    Initializes the database, reads the warnings of a member before and after each modification and finally deletes the
+    db file. Passes if every read reflects the current state of the database.
+    """
+    conn = DatabaseConnector("./test.sqlite", init_script=constants.DB_INIT_SCRIPT)
+    user_id = 47348382920304934
+
+    assert conn.get_member_warnings(user_id) is None
+    conn.add_member_warning(user_id, datetime.datetime.now(), "Spam")
+    warnings = conn.get_member_warnings(user_id)
+    conn.add_member_warning(user_id, datetime.datetime.now(), None)
+    cntr_warnings = len(conn.get_member_warnings(user_id))
+    user_id_warned = conn.get_warning_userid(warnings[0][0])
+    conn.remove_member_warning(warnings[0][0])
+    cntr_warnings_removed = len(conn.get_member_warnings(user_id))
+    conn.remove_member_warnings(user_id)
+    warnings_cleared = conn.get_member_warnings(user_id)
+
+    close_connection_pool("./test.sqlite")
+    os.remove("./test.sqlite")
+
+    assert cntr_warnings == 2
+    assert user_id_warned == user_id
+    assert cntr_warnings_removed == 1
+    assert warnings_cleared is None
+
+
+def test_change_modmail_statuses():
+    """Tests if the status of multiple modmail can be changed at once.
+
+    Initializes the database, adds two modmail, changes both of their statuses with a single call and finally deletes
+    the db file. Passes if each modmail has the status which has been set for it.
+    """
+    conn = DatabaseConnector("./test.sqlite", init_script=constants.DB_INIT_SCRIPT)
+    conn.add_modmail(47348382920304934, "PKlempe#001", datetime.datetime.now())
+    conn.add_modmail(47348382920304935, "PKlempe#001", datetime.datetime.now())
+    conn.change_modmail_statuses({47348382920304934: ModmailStatus.CLOSED,
+                                  47348382920304935: ModmailStatus.ASSIGNED})
+    res_closed = conn.get_modmail_status(47348382920304934)
+    res_assigned = conn.get_modmail_status(47348382920304935)
+
+    close_connection_pool("./test.sqlite")
+    os.remove("./test.sqlite")
+
+    assert res_closed == ModmailStatus.CLOSED
+    assert res_assigned == ModmailStatus.ASSIGNED
+
+
+def test_connection_pool():
+    """Tests if released connections are reused and their uncommitted changes are discarded.
+
+    Acquires a connection, starts a transaction without committing it and releases the connection again. Passes if the
+    next acquired connection is the same one and no longer has an open transaction.
+    """
+    pool = ConnectionPool(":memory:")
+    connection = pool.acquire()
+    connection.execute("CREATE TABLE Test(ID INTEGER)")
+    connection.execute("INSERT INTO Test VALUES (1)")
+    pool.release(connection)
+    connection_reused = pool.acquire()
+
+    assert connection_reused is connection
+    assert not connection_reused.in_transaction
+
+
+def test_connection_pool_wal():
+    """Tests if new connections of a pool use write-ahead logging.
+
+    Acquires a connection to a db file, reads its journal mode and finally deletes the db file. Passes if the journal
+    mode is WAL.
+    """
+    pool = ConnectionPool("./test.sqlite")
+    connection = pool.acquire()
+    journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    connection.close()
+    os.remove("./test.sqlite")
+
+    assert journal_mode == "wal"
+
+
+def test_member_names():
+    """Tests if the most recent names of a member are returned along with their formatted timestamps.
+
+    Initializes the database, adds three names with distinct timestamps, requests the two most recent ones and finally
+    deletes the db file. Passes if both names are returned in the correct order with their date and time.
+    """
+    conn = DatabaseConnector("./test.sqlite", init_script=constants.DB_INIT_SCRIPT)
+    user_id = 47348382920304934
+    timestamp = datetime.datetime(2023, 1, 1, 10, 0, tzinfo=datetime.timezone.utc)
+
+    for minutes, name in enumerate(["PKlempe", "Peter", "Klempe"]):
+        conn.add_member_name(user_id, name, timestamp + datetime.timedelta(minutes=minutes))
+    names = conn.get_member_names(user_id, 2)
+
+    close_connection_pool("./test.sqlite")
+    os.remove("./test.sqlite")
+
+    assert names == [("Klempe", "01.01.2023", "10:02:00"), ("Peter", "01.01.2023", "10:01:00")]
@@ -0,0 +1,24 @@
+"""Tests for the functions regarding time parsing."""
+
+import pytest
+from bot.utility.time_parsing import get_pretty_string_duration
+
+
+def test_pretty_string_duration():
+    """Tests if durations in the compact format as well as other formats supported by pytimeparse are parsed correctly.
+
+    Passes if both formats result in the same pretty string representation.
+    """
+    assert get_pretty_string_duration("2w 1h 8m") == "2 Wochen, 1 Stunde, 8 Minuten"
+    assert get_pretty_string_duration("1w1d") == "1 Woche, 1 Tag"
+    assert get_pretty_string_duration("1 week") == "1 Woche"
+
+
+def test_invalid_duration():
+    """Tests if invalid durations are rejected.
+
+    Passes if a ValueError is raised for each of them.
+    """
+    for duration in ["", "10", "1h30", "w", "1h1h", "1h 2h", "1m1h", "5s 1w"]:
+        with pytest.raises(ValueError):
+            get_pretty_string_duration(duration)
@@ -1,4 +1,5 @@
 """Init file for making modules available outside of this package."""
 
+from .confirmation_view import ConfirmationView
 from .course_selection import CourseSelect
 from .destructive_view import DestructiveView
@@ -0,0 +1,51 @@
+"""This module contains a subclass of the UI element View which lets a user confirm or cancel an operation."""
+import discord
+
+from bot import constants as const
+
+
+class ConfirmationView(discord.ui.View):
+    """Class which represents a View with two buttons for either confirming or cancelling an operation.
+
+    Only the user who requested the operation is able to use the buttons. The view stops as soon as one of them has
+    been pressed, after which `is_confirmed` holds the decision of the user.
+    """
+
+    def __init__(self, user: discord.abc.User, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = user
+        self.is_confirmed = False
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Callback method which checks if the interaction has been triggered by the user who has to decide.
+
+        Args:
+            interaction (discord.Interaction): The interaction which occurred.
+
+        Returns:
+            bool: A bool indicating if the callback of the pressed button should be called.
+        """
+        return interaction.user.id == self.user.id
+
+    @discord.ui.button(label="Bestätigen", emoji=const.EMOJI_CONFIRM, style=discord.ButtonStyle.success)
+    async def confirm(self, interaction: discord.Interaction, _button: discord.ui.Button):
+        """Callback method which gets called when the user confirms the operation.
+
+        Args:
+            interaction (discord.Interaction): The interaction during which this callback was triggered.
+            _button (discord.ui.Button): The button which has been pressed.
+        """
+        self.is_confirmed = True
+        await interaction.response.defer()
+        self.stop()
+
+    @discord.ui.button(label="Abbrechen", emoji=const.EMOJI_CANCEL, style=discord.ButtonStyle.danger)
+    async def cancel(self, interaction: discord.Interaction, _button: discord.ui.Button):
+        """Callback method which gets called when the user cancels the operation.
+
+        Args:
+            interaction (discord.Interaction): The interaction during which this callback was triggered.
+            _button (discord.ui.Button): The button which has been pressed.
+        """
+        await interaction.response.defer()
+        self.stop()
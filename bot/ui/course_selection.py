@@ -1,4 +1,5 @@
 """This module contains subclasses of some UI elements needed for the selection of university courses."""
+import asyncio
 from typing import List
 
 import discord
@@ -29,7 +30,7 @@ class CourseSelect(discord.ui.Select):
         missing_courses = []
 
         for course_id in self.values:
-            role_id = self._db_connector.get_course_role(course_id)
+            role_id = await asyncio.to_thread(self._db_connector.get_course_role, course_id)
 
             if not role_id:
                 missing_courses.append(course_id)
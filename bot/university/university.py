@@ -1,4 +1,5 @@
 """Contains a Cog for all functionality regarding our University."""
+import asyncio
 import itertools
 import operator
 import re
@@ -166,16 +167,18 @@ class UniversityCog(commands.Cog):
             raise ValueError("The offered Group was part of the requested groups. Offered Group {0}, "
                              "Requested Groups: {1}".format(offered_group, requested_groups))
 
-        self._db_connector.add_group_offer_and_requests(ctx.author.id, channel.id, offered_group, requested_groups)
+        await asyncio.to_thread(self._db_connector.add_group_offer_and_requests, ctx.author.id, channel.id, offered_group,
+                                requested_groups)
         embed = _build_group_exchange_offer_embed(ctx.author, channel, offered_group, requested_groups)
         message = await self.ch_group_exchange.send(embed=embed)
-        self._db_connector.update_group_exchange_message_id(ctx.author.id, channel.id, message.id)
+        await asyncio.to_thread(self._db_connector.update_group_exchange_message_id, ctx.author.id, channel.id,
+                                message.id)
 
         if ctx.channel != self.ch_group_exchange:
             await ctx.send(":white_check_mark: Dein Tauschangebot wurde erfolgreich erstellt!")
 
-        potential_candidates = self._db_connector.get_candidates_for_group_exchange(ctx.author.id, channel.id,
-                                                                                    offered_group, requested_groups)
+        potential_candidates = await asyncio.to_thread(self._db_connector.get_candidates_for_group_exchange,
+                                                       ctx.author.id, channel.id, offered_group, requested_groups)
         if potential_candidates:
             await self._notify_author_about_candidates(ctx.author, potential_candidates, self.ch_group_exchange,
                                                        channel)
@@ -194,10 +197,10 @@ class UniversityCog(commands.Cog):
             ctx (discord.ext.commands.Context): The context from which this command is invoked.
             channel (discord.TextChannel): The channel corresponding to the course.
         """
-        message_id = self._db_connector.get_group_exchange_message(ctx.author.id, channel.id)
+        message_id = await asyncio.to_thread(self._db_connector.get_group_exchange_message, ctx.author.id, channel.id)
 
         if message_id:
-            self._db_connector.remove_group_exchange_offer(ctx.author.id, channel.id)
+            await asyncio.to_thread(self._db_connector.remove_group_exchange_offer, ctx.author.id, channel.id)
             msg = await self.ch_group_exchange.fetch_message(message_id)
 
             await msg.delete()
@@ -249,7 +252,7 @@ class UniversityCog(commands.Cog):
         Args:
             ctx (discord.ext.commands.Context): The context from which this command is invoked.
         """
-        exchange_requests = self._db_connector.get_group_exchange_for_user(ctx.author.id)
+        exchange_requests = await asyncio.to_thread(self._db_connector.get_group_exchange_for_user, ctx.author.id)
         if exchange_requests:
             embed = await self._build_group_exchange_list_embed(exchange_requests)
             await ctx.author.send(embed=embed)
@@ -1,9 +1,64 @@
 """Module containing functions regarding time parsing."""
 
 from datetime import datetime, timedelta
+from typing import Optional
+
 from pytimeparse.timeparse import timeparse
 
 
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24, "w": 60 * 60 * 24 * 7}
+
+
+def _parse_compact_duration(duration: str) -> Optional[int]:
+    """Parses a duration consisting only of integers followed by a single-letter unit. (e.g. 2w 1h 8m)
+
+    This is the format used by most moderators as well as the bot itself, which is why it's parsed by a simple loop over
+    the characters instead of the regular expressions used by `pytimeparse`.
+
+    Just like with `pytimeparse`, each unit may only be used once and in descending order.
+
+    Args:
+        duration (str): The provided time duration in some human-readable form.
+
+    Returns:
+        Optional[int]: The amount of seconds or None, if the duration isn't in the compact format.
+    """
+    total = 0
+    number = None
+    previous_unit_seconds = None
+
+    for char in duration:
+        if "0" <= char <= "9":
+            number = (number or 0) * 10 + int(char)
+        elif number is not None and char.lower() in _UNIT_SECONDS:
+            unit_seconds = _UNIT_SECONDS[char.lower()]
+            if previous_unit_seconds is not None and unit_seconds >= previous_unit_seconds:
+                return None
+
+            total += number * unit_seconds
+            number = None
+            previous_unit_seconds = unit_seconds
+        elif char != " " or number is not None:
+            return None
+
+    return total if number is None and duration.strip() else None
+
+
+def _parse_duration(duration: str) -> Optional[int]:
+    """Converts a duration into the amount of seconds it represents.
+
+    Visit https://github.com/wroberts/pytimeparse for a complete list of accepted formats.
+
+    Args:
+        duration (str): The provided time duration in some human-readable form. (e.g. 2w 1h 8m)
+
+    Returns:
+        Optional[int]: The amount of seconds or None, if the duration couldn't be parsed.
+    """
+    seconds = _parse_compact_duration(duration)
+    return seconds if seconds is not None else timeparse(duration)
+
+
 def get_pretty_string_duration(duration: str) -> str:
     """Converts a duration into a pretty string representation.
 
@@ -13,7 +68,7 @@ def get_pretty_string_duration(duration: str) -> str:
     Returns:
         str: The provided duration in an easily readable form.
     """
-    seconds = timeparse(duration)
+    seconds = _parse_duration(duration)
 
     if not seconds or seconds < 1:
         raise ValueError("Invalid duration.")
@@ -45,7 +100,7 @@ def get_future_timestamp(duration: str) -> datetime:
     Returns:
         datetime: A timestamp representing the moment in the future after the duration has passed.
     """
-    delta_seconds = timeparse(duration)
+    delta_seconds = _parse_duration(duration)
 
     if not delta_seconds or delta_seconds < 1:
         raise ValueError("Invalid duration.")